@@ -3,6 +3,7 @@ FastAPI Backend  (v4.2)
 =======================
 New endpoints:
   POST /chat              — with prompt_version in response
+  POST /chat/stream       — same, streamed token-by-token as SSE
   GET  /prompts           — list all prompt versions
   GET  /eval/latest       — last evaluation results
   POST /eval/run          — trigger evaluation run (background)
@@ -10,11 +11,18 @@ New endpoints:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import partial
 
+import orjson
 import uvicorn
-from fastapi import BackgroundTasks, FastAPI, HTTPException
-from pydantic import BaseModel, Field, field_validator
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.background import BackgroundTask
 
 import src.config as cfg
 from src.ingestion.pipeline import IngestionPipeline
@@ -25,50 +33,100 @@ from src.vector_store.manager import VectorStoreManager
 
 log = get_logger("API")
 
-_engine:       RAGEngine | None = None
-_rate_limiter: RateLimiter      = RateLimiter()
+# RAGEngine.query blocks (retrieval + LLM); run it here so the event loop
+# keeps serving /health and other requests meanwhile.
+_executor = ThreadPoolExecutor(max_workers=cfg.API_THREADS, thread_name_prefix="chat")
+
+router = APIRouter()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _engine
     log.info("Server starting…")
     try:
         vs_mgr   = VectorStoreManager()
         pipeline = IngestionPipeline()
+
+        def _invalidate_answers() -> None:
+            # registered before load_or_create so the (re)build it may run fires it too
+            if app.state.engine is not None:
+                app.state.engine.clear_caches()
+            cfg.ANSWER_CACHE_SNAPSHOT.unlink(missing_ok=True)
+
+        vs_mgr.on_rebuild(_invalidate_answers)
         vs, bm25 = vs_mgr.load_or_create(pipeline.run)
-        _engine  = RAGEngine(vs, bm25)
+        engine   = RAGEngine(vs, bm25)
+        if cfg.ANSWER_CACHE_PERSIST:
+            engine.answer_cache.load(cfg.ANSWER_CACHE_SNAPSHOT, tag=vs_mgr.index_version)
+        app.state.vs_mgr = vs_mgr
+        app.state.engine = engine
+        # registry is read-only after init — serialise /prompts once
+        app.state.prompts_body = orjson.dumps({
+            "active":   engine.prompt_registry.get().version,
+            "versions": engine.prompt_registry.list_versions(),
+        })
         log.info("Server ready")
     except Exception as exc:
         log.critical(f"Startup failed: {exc}", exc_info=True)
         raise
     yield
+    if cfg.ANSWER_CACHE_PERSIST and app.state.engine is not None:
+        try:
+            app.state.engine.answer_cache.save(
+                cfg.ANSWER_CACHE_SNAPSHOT, tag=app.state.vs_mgr.index_version
+            )
+        except Exception as exc:
+            log.warning(f"Answer cache snapshot failed: {exc}")
+    app.state.engine = None
     log.info("Shutdown")
 
 
-app = FastAPI(
-    title=cfg.API_TITLE,
-    version=cfg.API_VERSION,
-    lifespan=lifespan,
-)
+def create_app() -> FastAPI:
+    """
+    Build a fully wired FastAPI app. One engine per app, created in lifespan.
+
+        uvicorn src.api:create_app --factory
+    """
+    app = FastAPI(
+        title=cfg.API_TITLE,
+        version=cfg.API_VERSION,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    app.state.engine       = None
+    app.state.vs_mgr       = None
+    app.state.rate_limiter = RateLimiter()
+    app.state.chat_slots   = asyncio.Semaphore(cfg.MAX_INFLIGHT_CHATS)
+    app.include_router(router)
+    return app
+
+
+def _get_engine(request: Request) -> RAGEngine:
+    engine = request.app.state.engine
+    if engine is None:
+        raise HTTPException(503, "Engine not ready")
+    return engine
+
+
+def _check_rate(request: Request, session_id: str) -> None:
+    allowed, msg = request.app.state.rate_limiter.check(session_id)
+    if not allowed:
+        raise HTTPException(429, msg, headers={"Retry-After": "60"})
 
 
 # ── Models ────────────────────────────────────────────────────────────────────
 class ChatRequest(BaseModel):
+    # stripping happens in pydantic-core, before min_length — blank → 422
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
     query:          str = Field(..., min_length=1, max_length=cfg.MAX_QUERY_LENGTH)
     session_id:     str = Field(default="default", min_length=1, max_length=100)
     prompt_version: str | None = Field(default=None)
 
-    @field_validator("query")
-    @classmethod
-    def strip_query(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("query must not be blank")
-        return v
-
 
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     answer:         str
     sources:        list[int]
     prompt_version: str
@@ -76,109 +134,271 @@ class ChatResponse(BaseModel):
 
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
-@app.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest):
-    if _engine is None:
-        raise HTTPException(503, "Engine not ready")
-
-    allowed, msg = _rate_limiter.check(req.session_id)
-    if not allowed:
-        raise HTTPException(429, msg, headers={"Retry-After": "60"})
-
-    try:
-        result = _engine.query(
+@router.post("/chat", response_model=ChatResponse)
+async def chat(
+    req: ChatRequest,
+    request: Request,
+    response: Response,
+    engine: RAGEngine = Depends(_get_engine),
+):
+    """
+    An answer that is its session's newest turn carries an ETag over that
+    answer (plus query, index and prompt version); resubmitting with
+    If-None-Match gets 304 without an LLM call until the session moves on.
+    """
+    if if_none_match := request.headers.get("if-none-match"):
+        issued = _turn_etag(req, request, engine)
+        if issued and _etag_matches(if_none_match, issued[0]):
+            return Response(status_code=304, headers={"ETag": issued[0]})
+
+    _check_rate(request, req.session_id)
+
+    # shed load instead of queueing: a full house answers 503 immediately
+    slots = request.app.state.chat_slots
+    if slots.locked():
+        raise HTTPException(503, "Server busy", headers={"Retry-After": "1"})
+
+    await slots.acquire()
+    work = asyncio.get_running_loop().run_in_executor(
+        _executor,
+        partial(
+            engine.query,
             req.query,
             session_id=req.session_id,
             prompt_version=req.prompt_version,
-        )
+        ),
+    )
+    # the executor thread can't be cancelled — keep the slot until it really
+    # finishes, even after we've answered 504, so MAX_INFLIGHT_CHATS bounds work
+    work.add_done_callback(partial(_release_slot, slots))
+    try:
+        result = await asyncio.wait_for(asyncio.shield(work), timeout=cfg.CHAT_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        log.error(f"Query timed out after {cfg.CHAT_TIMEOUT_S}s")
+        raise HTTPException(504, "Query timed out")
     except ValueError as exc:
         raise HTTPException(400, str(exc))
     except Exception as exc:
         log.error(f"Query error: {exc}", exc_info=True)
         raise HTTPException(500, "Internal error")
 
-    answer   = result.get("answer", "")
-    ctx_docs = result.get("context", [])
-    pages    = sorted({int(d.metadata.get("page", 0)) + 1 for d in ctx_docs})
-    refs     = [d.metadata.get("reference_path", "—") for d in ctx_docs[:5]]
-    sources  = list({d.metadata.get("source_file", "") for d in ctx_docs if d.metadata.get("source_file")})
-    reranks  = [d.metadata.get("rerank_score") for d in ctx_docs if "rerank_score" in d.metadata]
-
+    answer = result.get("answer", "")
+    # cache hits, refusals and redacted answers never reach the history — no tag
+    issued = _turn_etag(req, request, engine)
+    if issued and issued[1] == answer:
+        response.headers["ETag"] = issued[0]
+    pages, metadata = _summarise_context(result.get("context", []))
     return ChatResponse(
         answer=answer,
         sources=pages,
         prompt_version=result.get("prompt_version", "unknown"),
-        metadata={
-            "total_sources":  len(ctx_docs),
-            "references":     refs,
-            "source_files":   sources,
-            "rerank_scores":  reranks[:5],
-        },
+        metadata=metadata,
     )
 
 
-@app.get("/prompts")
-async def list_prompts():
-    if _engine is None:
-        raise HTTPException(503, "Engine not ready")
-    return {
-        "active": _engine.prompt_registry.get().version,
-        "versions": _engine.prompt_registry.list_versions(),
+@router.post("/chat/stream")
+async def chat_stream(req: ChatRequest, request: Request, engine: RAGEngine = Depends(_get_engine)):
+    """
+    Server-Sent Events: one `data: {"delta": …}` per answer token, then a
+    final `data: {"answer", "sources", "prompt_version", "metadata"}` event.
+    Shares /chat's in-flight slots and CHAT_TIMEOUT_S (whole stream).
+    """
+    _check_rate(request, req.session_id)
+
+    slots = request.app.state.chat_slots
+    if slots.locked():
+        raise HTTPException(503, "Server busy", headers={"Retry-After": "1"})
+    await slots.acquire()
+    released = False
+
+    def _release() -> None:
+        # the generator's finally never runs if the response never starts,
+        # so the background task is the fallback; whichever comes first wins
+        nonlocal released
+        if not released:
+            released = True
+            slots.release()
+
+    async def _events():
+        loop     = asyncio.get_running_loop()
+        deadline = loop.time() + cfg.CHAT_TIMEOUT_S
+        stream   = engine.astream(
+            req.query,
+            session_id=req.session_id,
+            prompt_version=req.prompt_version,
+        )
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(anext(stream), deadline - loop.time())
+                except StopAsyncIteration:
+                    break
+                if "delta" in event:
+                    yield _sse({"delta": event["delta"]})
+                    continue
+                result = event["result"]
+                pages, metadata = _summarise_context(result.get("context", []))
+                yield _sse({
+                    "answer":         result.get("answer", ""),
+                    "sources":        pages,
+                    "prompt_version": result.get("prompt_version", "unknown"),
+                    "metadata":       metadata,
+                })
+        except asyncio.TimeoutError:
+            log.error(f"Stream timed out after {cfg.CHAT_TIMEOUT_S}s")
+            yield _sse({"error": "Query timed out"})
+        except Exception as exc:
+            log.error(f"Stream error: {exc}", exc_info=True)
+            yield _sse({"error": "Internal error"})
+        finally:
+            try:
+                await stream.aclose()
+            finally:
+                _release()
+
+    return StreamingResponse(_events(), media_type="text/event-stream", background=BackgroundTask(_release))
+
+
+def _release_slot(slots: asyncio.Semaphore, work: asyncio.Future) -> None:
+    slots.release()
+    if not work.cancelled():
+        work.exception()   # mark retrieved — nobody awaits it after a timeout
+
+
+def _etag(req: ChatRequest, index_version: str, prompt_version: str, answer: str) -> str:
+    key = f"{req.query}|{req.session_id}|{index_version}|{prompt_version}|{answer}"
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+
+def _turn_etag(req: ChatRequest, request: Request, engine: RAGEngine) -> tuple[str, str] | None:
+    """(ETag, answer) of the session's newest turn, if that turn answered req.query."""
+    turn = engine.last_turn(req.session_id)
+    if turn is None or turn[0] != req.query:
+        return None
+    etag = _etag(
+        req,
+        request.app.state.vs_mgr.index_version,
+        engine.prompt_registry.get(req.prompt_version).version,
+        turn[1],
+    )
+    return etag, turn[1]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # concrete tags only — "*" means "any representation exists", and a POST
+    # for a query never answered has none, so it must not short-circuit
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return etag in tags
+
+
+def _summarise_context(ctx_docs: list) -> tuple[list[int], dict]:
+    """Page numbers + response metadata for the retrieved context docs."""
+    pages:   set[int]    = set()
+    sources: set[str]    = set()
+    refs:    list[str]   = []
+    reranks: list[float] = []
+    # one pass, one .metadata dereference per doc
+    for i, d in enumerate(ctx_docs):
+        m = d.metadata
+        pages.add(int(m.get("page", 0)) + 1)
+        if src := m.get("source_file"):
+            sources.add(src)
+        if i < 5:
+            refs.append(m.get("reference_path", "—"))
+        if len(reranks) < 5 and "rerank_score" in m:
+            reranks.append(m["rerank_score"])
+    return sorted(pages), {
+        "total_sources":  len(ctx_docs),
+        "references":     refs,
+        "source_files":   list(sources),
+        "rerank_scores":  reranks,
     }
 
 
-@app.get("/eval/latest")
+def _sse(payload: dict) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+@router.get("/prompts")
+async def list_prompts(request: Request, engine: RAGEngine = Depends(_get_engine)):
+    return Response(request.app.state.prompts_body, media_type="application/json")
+
+
+@router.get("/eval/latest")
 async def eval_latest():
-    import json
     path = cfg.EVAL_DIR / "latest_results.json"
     if not path.exists():
         raise HTTPException(404, "No evaluation results yet. POST /eval/run first.")
-    with open(path) as f:
-        return json.load(f)
+    # already JSON on disk — serve the bytes, no parse/re-serialise round trip
+    return Response(path.read_bytes(), media_type="application/json")
 
 
-@app.post("/eval/run")
-async def eval_run(background_tasks: BackgroundTasks, version: str | None = None, quick: bool = False):
-    if _engine is None:
-        raise HTTPException(503, "Engine not ready")
-
+@router.post("/eval/run")
+async def eval_run(
+    background_tasks: BackgroundTasks,
+    version: str | None = None,
+    quick: bool = False,
+    engine: RAGEngine = Depends(_get_engine),
+):
     def _run():
         from src.evaluation.ragas_eval import RAGASEvaluator
-        RAGASEvaluator(_engine).run(prompt_version=version, limit=5 if quick else None)
+        RAGASEvaluator(engine).run(prompt_version=version, limit=5 if quick else None)
 
     background_tasks.add_task(_run)
     return {"message": "Evaluation started in background. GET /eval/latest when done."}
 
 
-@app.get("/health")
-async def health():
-    return {"status": "ok" if _engine else "degraded", "engine": _engine is not None}
+@router.get("/health")
+async def health(request: Request):
+    body = _HEALTH_OK if request.app.state.engine is not None else _HEALTH_DEGRADED
+    return Response(body, media_type="application/json")
 
 
-@app.get("/metrics")
-async def metrics():
-    if _engine is None:
-        raise HTTPException(503, "Engine not ready")
-    return _engine.tracker.stats()
+@router.get("/metrics")
+async def metrics(engine: RAGEngine = Depends(_get_engine)):
+    return engine.tracker.stats()
 
 
-@app.post("/cache/clear")
-async def cache_clear():
-    if _engine is None:
-        raise HTTPException(503, "Engine not ready")
-    _engine._cache.clear()
+@router.post("/cache/clear")
+async def cache_clear(engine: RAGEngine = Depends(_get_engine)):
+    engine.clear_caches()
     return {"message": "cache cleared"}
 
 
-@app.get("/")
+@router.get("/cache/stats")
+async def cache_stats(engine: RAGEngine = Depends(_get_engine)):
+    return engine.cache_stats()
+
+
+@router.get("/")
 async def root():
-    return {
-        "name":           cfg.API_TITLE,
-        "version":        cfg.API_VERSION,
-        "docs":           "/docs",
-        "endpoints":      ["/chat", "/prompts", "/eval/latest", "/eval/run", "/health", "/metrics"],
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+# ── Static bodies — serialised once, health-checkers hit these constantly ─────
+_ROOT_BODY = orjson.dumps({
+    "name":           cfg.API_TITLE,
+    "version":        cfg.API_VERSION,
+    "docs":           "/docs",
+    "endpoints":      ["/chat", "/chat/stream", "/prompts", "/eval/latest", "/eval/run", "/health", "/metrics", "/cache/stats"],
+})
+_HEALTH_OK       = orjson.dumps({"status": "ok",       "engine": True})
+_HEALTH_DEGRADED = orjson.dumps({"status": "degraded", "engine": False})
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
-    uvicorn.run("src.api:app", host=cfg.API_HOST, port=cfg.API_PORT, reload=False)
+    uvicorn.run(
+        "src.api:app",
+        host=cfg.API_HOST,
+        port=cfg.API_PORT,
+        workers=cfg.API_WORKERS,
+        loop="uvloop",          # both ship with uvicorn[standard]
+        http="httptools",
+        access_log=cfg.API_ACCESS_LOG,
+        reload=False,
+    )
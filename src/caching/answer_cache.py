@@ -0,0 +1,191 @@
+"""
+Semantic Answer Cache
+=====================
+Near-duplicate questions ("what is the right to erasure?" vs "explain the
+right to erasure") skip retrieval + LLM entirely.
+
+  - In-memory FAISS IndexFlatIP over L2-normalised query embeddings
+    (inner product == cosine similarity)
+  - Parallel list of cached results, kept aligned with the index ids
+  - Hit = nearest entry with cosine >= ANSWER_CACHE_THRESHOLD *and* a
+    matching scope (prompt version + structural refs) — "Article 15" and
+    "Article 16" embed almost identically but must never share an answer
+  - Eviction: TTL first, then least-frequently-used (LRU as tie-break)
+  - Cleared whenever the FAISS corpus is rebuilt
+  - save()/load() snapshot to disk so restarts start warm; the snapshot
+    carries a schema version + caller tag (FAISS index version) and is
+    ignored when either differs
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import faiss
+import numpy as np
+
+import src.config as cfg
+from src.logger import get_logger
+
+log = get_logger("AnswerCache")
+
+_SNAPSHOT_VERSION = 1
+_SEARCH_K         = 8   # neighbours checked for a scope match per lookup
+
+
+@dataclass
+class _Entry:
+    scope:     str
+    result:    dict
+    created:   float
+    last_used: float
+    hits:      int = 0
+
+
+class SemanticAnswerCache:
+
+    def __init__(
+        self,
+        max_size:  int   = cfg.ANSWER_CACHE_SIZE,
+        threshold: float = cfg.ANSWER_CACHE_THRESHOLD,
+        ttl_s:     float = cfg.ANSWER_CACHE_TTL_S,
+    ) -> None:
+        self._max       = max_size
+        self._threshold = threshold
+        self._ttl       = ttl_s
+        self._index: Optional[faiss.IndexFlatIP] = None   # dim known on first add
+        self._entries: list[_Entry] = []
+        self._lock = threading.Lock()
+
+    # ── public ────────────────────────────────────────────────────────────────
+    def get(self, embedding: list[float], scope: str) -> Optional[dict]:
+        with self._lock:
+            if not self._entries:
+                return None
+            now = time.monotonic()
+            self._purge_expired(now)
+            if not self._entries:
+                return None
+
+            # several neighbours: an out-of-scope nearest entry must not hide
+            # an in-scope one that is also above the threshold
+            k = min(_SEARCH_K, len(self._entries))
+            scores, ids = self._index.search(_as_unit_row(embedding), k)
+            for pos, score in zip(ids[0].tolist(), scores[0].tolist()):
+                if pos < 0 or score < self._threshold:
+                    break                  # results are sorted best-first
+                entry = self._entries[pos]
+                if entry.scope == scope:
+                    entry.hits += 1
+                    entry.last_used = now
+                    log.info("Semantic HIT (cos=%.3f)", score)
+                    return entry.result
+            log.debug("Semantic MISS (best=%.3f)", float(scores[0][0]))
+            return None
+
+    def add(self, embedding: list[float], scope: str, result: dict) -> None:
+        vec = _as_unit_row(embedding)
+        with self._lock:
+            if self._index is None or self._index.d != vec.shape[1]:
+                self._index = faiss.IndexFlatIP(vec.shape[1])
+                self._entries = []
+            if len(self._entries) >= self._max:
+                self._evict_one()
+            now = time.monotonic()
+            self._index.add(vec)
+            self._entries.append(_Entry(scope=scope, result=result, created=now, last_used=now))
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._index is not None:
+                self._index.reset()
+            self._entries = []
+        log.info("Answer cache cleared")
+
+    def save(self, path: Path, tag: str = "") -> int:
+        """Write a snapshot (atomic replace). Returns the number of entries saved."""
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+            vectors = self._index.reconstruct_n(0, self._index.ntotal) if self._entries else None
+            # monotonic clocks don't survive a restart — store ages instead
+            entries = [
+                (e.scope, e.result, now - e.created, now - e.last_used, e.hits)
+                for e in self._entries
+            ]
+        state = {"version": _SNAPSHOT_VERSION, "tag": tag, "vectors": vectors, "entries": entries}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        log.info(f"Answer cache saved: {len(entries)} entries → {path}")
+        return len(entries)
+
+    def load(self, path: Path, tag: str = "") -> int:
+        """Replace contents with a snapshot from save(). Returns entries loaded."""
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return 0
+        except Exception as exc:
+            log.warning(f"Answer cache snapshot unreadable ({exc}) — starting cold")
+            return 0
+        if state.get("version") != _SNAPSHOT_VERSION or state.get("tag") != tag:
+            log.info("Answer cache snapshot is stale — starting cold")
+            return 0
+
+        now  = time.monotonic()
+        keep = [i for i, e in enumerate(state["entries"]) if e[2] <= self._ttl][-self._max:]
+        with self._lock:
+            self._entries = [
+                _Entry(scope=scope, result=result, created=now - age, last_used=now - idle, hits=hits)
+                for scope, result, age, idle, hits in (state["entries"][i] for i in keep)
+            ]
+            if keep:
+                vectors = state["vectors"][keep]
+                self._index = faiss.IndexFlatIP(vectors.shape[1])
+                self._index.add(vectors)
+            elif self._index is not None:
+                self._index.reset()
+        log.info(f"Answer cache warmed: {len(keep)} entries from {path}")
+        return len(keep)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max
+
+    # ── private ───────────────────────────────────────────────────────────────
+    def _purge_expired(self, now: float) -> None:
+        expired = [i for i, e in enumerate(self._entries) if now - e.created > self._ttl]
+        if expired:
+            self._remove(expired)
+
+    def _evict_one(self) -> None:
+        victim = min(
+            range(len(self._entries)),
+            key=lambda i: (self._entries[i].hits, self._entries[i].last_used),
+        )
+        self._remove([victim])
+
+    def _remove(self, positions: list[int]) -> None:
+        # IndexFlat.remove_ids compacts in order, so the list stays aligned
+        self._index.remove_ids(np.asarray(positions, dtype=np.int64))
+        drop = set(positions)
+        self._entries = [e for i, e in enumerate(self._entries) if i not in drop]
+
+
+def _as_unit_row(embedding: list[float]) -> np.ndarray:
+    vec = np.asarray(embedding, dtype=np.float32).reshape(1, -1).copy()
+    faiss.normalize_L2(vec)
+    return vec
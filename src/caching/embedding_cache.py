@@ -0,0 +1,58 @@
+"""
+Embedding Cache
+===============
+Wraps any LangChain Embeddings so repeated query strings skip the
+embedding model entirely.  Keyed on whitespace-normalised query text.
+
+Only embed_query() is cached — document embedding happens once at
+ingestion and never repeats.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from langchain_core.embeddings import Embeddings
+
+import src.config as cfg
+from src.logger import get_logger
+
+log = get_logger("EmbeddingCache")
+
+
+def normalise_query(text: str) -> str:
+    """Canonical form used as cache key (collapse whitespace, strip)."""
+    return " ".join(text.split())
+
+
+class CachedEmbeddings(Embeddings):
+
+    def __init__(self, inner: Embeddings, max_size: int = cfg.EMBED_CACHE_SIZE) -> None:
+        self._inner = inner
+        # per-instance LRU — tuples so cached vectors can't be mutated by callers
+        self._embed = lru_cache(maxsize=max_size)(self._embed_uncached)
+
+    # ── Embeddings interface ──────────────────────────────────────────────────
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return list(self._embed(normalise_query(text)))
+
+    # ── diagnostics ───────────────────────────────────────────────────────────
+    def cache_info(self) -> dict:
+        info = self._embed.cache_info()
+        return {
+            "hits":     info.hits,
+            "misses":   info.misses,
+            "size":     info.currsize,
+            "max_size": info.maxsize,
+        }
+
+    def cache_clear(self) -> None:
+        self._embed.cache_clear()
+        log.info("Embedding cache cleared")
+
+    # ── private ───────────────────────────────────────────────────────────────
+    def _embed_uncached(self, text: str) -> tuple[float, ...]:
+        return tuple(self._inner.embed_query(text))
@@ -45,6 +45,10 @@ class QueryCache:
         self._data.clear()
         log.info("Cache cleared")
 
+    @property
+    def max_size(self) -> int:
+        return self._max
+
     def __len__(self) -> int:
         return len(self._data)
 
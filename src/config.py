@@ -1,6 +1,10 @@
 """
 Configuration  (v4.2) — single source of truth.
 All values come from environment variables via .env
+
+Values are resolved once, at first import, into plain module attributes.
+Read them as `cfg.X` (a module-dict lookup) rather than copying them
+into locals at import time, so tests can monkeypatch them.
 """
 
 from __future__ import annotations
@@ -9,8 +13,6 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-load_dotenv()
-
 # ── Base paths ────────────────────────────────────────────────────────────────
 BASE_DIR      = Path(__file__).resolve().parent.parent
 DATA_DIR      = BASE_DIR / "data" / "pdfs"
@@ -19,6 +21,10 @@ LOG_DIR       = BASE_DIR / "logs"
 EVAL_DIR      = BASE_DIR / "evaluation"
 PROMPTS_DIR   = BASE_DIR / "prompts"
 
+# Explicit path: no find_dotenv() frame inspection + directory walk. Runs
+# once per process — this module is only ever executed on first import.
+load_dotenv(BASE_DIR / ".env")
+
 # ── Required secrets ──────────────────────────────────────────────────────────
 OPENAI_API_KEY: str = os.environ["OPENAI_API_KEY"]
 
@@ -27,28 +33,87 @@ LLM_MODEL        = os.getenv("LLM_MODEL",        "gpt-4o-mini")
 EMBEDDING_MODEL  = os.getenv("EMBEDDING_MODEL",  "sentence-transformers/all-MiniLM-L6-v2")
 RERANKER_MODEL   = os.getenv("RERANKER_MODEL",   "cross-encoder/ms-marco-MiniLM-L-6-v2")
 
+# Optional TEI sidecar — "http://host:port" or "unix:///path.sock"; empty = local model
+EMBEDDING_SERVER = os.getenv("EMBEDDING_SERVER", "")
+RERANKER_SERVER  = os.getenv("RERANKER_SERVER",  "")
+
+# Run one dummy rerank at startup so model load + first-inference cost isn't paid by a user
+RERANKER_WARMUP = os.getenv("RERANKER_WARMUP", "true").lower() == "true"
+
+# Concurrent query embeddings are coalesced into one model call
+EMBED_MAX_BATCH   = int(os.getenv("EMBED_MAX_BATCH",     "32"))
+EMBED_MAX_WAIT_MS = float(os.getenv("EMBED_MAX_WAIT_MS", "5"))
+
+# Max concurrent LLM calls per RAGEngine.abatch_query()
+LLM_CONCURRENCY  = int(os.getenv("LLM_CONCURRENCY",  "8"))
+
 # ── Prompt versioning ─────────────────────────────────────────────────────────
 PROMPT_VERSION   = os.getenv("PROMPT_VERSION",   "latest")
 
 # ── Ingestion ─────────────────────────────────────────────────────────────────
 CHUNK_SIZE    = int(os.getenv("CHUNK_SIZE",    "1500"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "200"))
+# >0 → split oversized chunks by EMBEDDING_MODEL tokens instead of characters
+# (all-MiniLM-L6-v2 reads 256 tokens); 0 keeps the character splitter above
+CHUNK_TOKENS         = int(os.getenv("CHUNK_TOKENS",         "0"))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "32"))
+# Finest unit that gets its own chunk: "subpoint" | "point" | "article".
+# Coarser levels fold lower units into their parent → fewer chunks to embed.
+CHUNK_GRANULARITY = os.getenv("CHUNK_GRANULARITY", "subpoint")
+# PDFs parsed in parallel (one process each); 1 = serial, in-process
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Near-duplicate chunks (SimHash Hamming distance ≤ DEDUP_MAX_DISTANCE) are dropped before embedding
+DEDUP_CHUNKS       = os.getenv("DEDUP_CHUNKS", "true").lower() == "true"
+DEDUP_MAX_DISTANCE = int(os.getenv("DEDUP_MAX_DISTANCE", "3"))
+DEDUP_MIN_CHARS    = int(os.getenv("DEDUP_MIN_CHARS",    "200"))
+
+# Split Documents are cached per (PDF hash, chunking config) so unchanged PDFs skip parse + split
+SPLIT_CACHE     = os.getenv("SPLIT_CACHE", "true").lower() == "true"
+SPLIT_CACHE_DIR = BASE_DIR / "storage" / "split_cache"
+
+# ── Vector store ──────────────────────────────────────────────────────────────
+# "flat" = exact FP32 IndexFlatL2 · "hnsw_sq8" = HNSW graph over int8 codes
+FAISS_INDEX_TYPE     = os.getenv("FAISS_INDEX_TYPE", "hnsw_sq8")
+FAISS_HNSW_M         = int(os.getenv("FAISS_HNSW_M",         "32"))
+FAISS_HNSW_EF_SEARCH = int(os.getenv("FAISS_HNSW_EF_SEARCH", "64"))
 
 # ── Retrieval ─────────────────────────────────────────────────────────────────
 RETRIEVAL_K       = int(os.getenv("RETRIEVAL_K",       "6"))
 RETRIEVAL_K_FETCH = int(os.getenv("RETRIEVAL_K_FETCH", "20"))
 
+# ── Chat sessions ─────────────────────────────────────────────────────────────
+MAX_SESSIONS      = int(os.getenv("MAX_SESSIONS",      "1000"))   # LRU-evicted beyond this
+MAX_HISTORY_TURNS = int(os.getenv("MAX_HISTORY_TURNS", "10"))     # Q/A pairs kept per session
+
 # ── API ───────────────────────────────────────────────────────────────────────
 API_HOST    = os.getenv("API_HOST",    "0.0.0.0")
 API_PORT    = int(os.getenv("API_PORT", "8000"))
+API_THREADS = int(os.getenv("API_THREADS", "8"))    # blocking /chat calls in flight
+API_WORKERS = int(os.getenv("API_WORKERS", "2"))    # gunicorn processes (src/serve.py)
 API_TITLE   = "GDPR Legal RAG API"
 API_VERSION = "4.2"
 
+API_ACCESS_LOG = os.getenv("API_ACCESS_LOG", "false").lower() == "true"   # per-request log line
+
 MAX_QUERY_LENGTH = 2000
 
+# /chat admission control: beyond this many in flight → 503, slower than timeout → 504
+MAX_INFLIGHT_CHATS = int(os.getenv("MAX_INFLIGHT_CHATS", str(API_THREADS)))
+CHAT_TIMEOUT_S     = float(os.getenv("CHAT_TIMEOUT_S",   "60"))
+
 # ── Rate limiting ─────────────────────────────────────────────────────────────
 RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_RPM", "15"))
 RATE_LIMIT_RPH = int(os.getenv("RATE_LIMIT_RPH", "200"))
 
 # ── Cache ─────────────────────────────────────────────────────────────────────
-CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1000"))
+CACHE_MAX_SIZE   = int(os.getenv("CACHE_MAX_SIZE",   "1000"))
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "1024"))
+
+ANSWER_CACHE_SIZE      = int(os.getenv("ANSWER_CACHE_SIZE",        "512"))
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.97"))
+ANSWER_CACHE_TTL_S     = float(os.getenv("ANSWER_CACHE_TTL_S",     "3600"))
+
+# Answer cache is snapshotted on shutdown and reloaded on startup (warm restarts)
+ANSWER_CACHE_PERSIST  = os.getenv("ANSWER_CACHE_PERSIST", "true").lower() == "true"
+ANSWER_CACHE_SNAPSHOT = BASE_DIR / "storage" / "answer_cache.pkl"
@@ -26,7 +26,6 @@ import argparse
 import json
 import time
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Optional
 
 import src.config as cfg
@@ -34,7 +33,7 @@ from src.logger import get_logger
 
 log = get_logger("Evaluation")
 
-_TESTSET_PATH  = Path(__file__).resolve().parent.parent.parent / "evaluation" / "gdpr_testset.json"
+_TESTSET_PATH  = cfg.EVAL_DIR / "gdpr_testset.json"
 _RESULTS_DIR   = cfg.EVAL_DIR
 _RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
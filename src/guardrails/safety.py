@@ -23,7 +23,10 @@ _INJECTION = re.compile(
 )
 
 # System prompt leak markers
-_LEAK = re.compile(r'(you are an expert legal|langchain)', re.I)
+_LEAK_MARKERS = ("you are an expert legal", "langchain")
+_LEAK = re.compile("(" + "|".join(map(re.escape, _LEAK_MARKERS)) + ")", re.I)
+# a marker not yet complete in a stream can only start this close to its end
+_LEAK_HOLDBACK = max(map(len, _LEAK_MARKERS)) - 1
 
 
 class SafetyGuardrails:
@@ -49,3 +52,34 @@ class SafetyGuardrails:
             log.warning("System prompt leak detected")
             return False
         return True
+
+
+class StreamingOutputGuard:
+    """
+    Output check for streamed answers. feed() releases text only once no
+    leak marker can still be completed by later tokens (the last
+    _LEAK_HOLDBACK chars are held back); after a match it releases nothing
+    and sets .blocked. tail() returns the held-back text once the full
+    answer has passed check_output().
+    """
+
+    def __init__(self) -> None:
+        self._text   = ""
+        self._sent   = 0
+        self.blocked = False
+
+    def feed(self, delta: str) -> str:
+        if self.blocked:
+            return ""
+        self._text += delta
+        # text before _sent - HOLDBACK was already searched with full lookahead
+        if _LEAK.search(self._text, max(0, self._sent - _LEAK_HOLDBACK)):
+            log.warning("System prompt leak detected mid-stream")
+            self.blocked = True
+            return ""
+        end = max(self._sent, len(self._text) - _LEAK_HOLDBACK)
+        out, self._sent = self._text[self._sent:end], end
+        return out
+
+    def tail(self) -> str:
+        return "" if self.blocked else self._text[self._sent:]
@@ -0,0 +1,73 @@
+"""
+Near-Duplicate Filter
+=====================
+64-bit SimHash over word 3-grams; a chunk is dropped when its fingerprint
+is within DEDUP_MAX_DISTANCE bits of one already kept.
+
+  - Fingerprints are split into 4 × 16-bit bands. Two fingerprints that
+    differ in ≤ 3 bits must agree on at least one band (pigeonhole), so
+    only chunks sharing a band are compared — O(N), not O(N²)
+  - Shingles are hashed with blake2b, not hash(), so the same corpus
+    dedups identically across runs (PYTHONHASHSEED varies per process)
+  - Chunks shorter than DEDUP_MIN_CHARS are always kept: short GDPR points
+    ("(a) the data subject has given consent…") legitimately repeat
+    across articles and carry different references
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+
+import numpy as np
+
+import src.config as cfg
+
+_BANDS     = 4
+_BAND_BITS = 64 // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def simhash(text: str) -> int:
+    words = text.lower().split()
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))]
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    # per-bit majority vote across shingles
+    bits  = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1)
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big")
+
+
+class NearDuplicateFilter:
+    """Stateful — feed every chunk of a run through one instance."""
+
+    def __init__(
+        self,
+        max_distance: int = cfg.DEDUP_MAX_DISTANCE,
+        min_chars:    int = cfg.DEDUP_MIN_CHARS,
+    ) -> None:
+        if max_distance >= _BANDS:
+            raise ValueError(f"max_distance must be < {_BANDS} for {_BANDS}-band LSH")
+        self._max_distance = max_distance
+        self._min_chars    = min_chars
+        self._buckets: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+        self.dropped = 0
+
+    def is_new(self, text: str) -> bool:
+        """True (and remember it) unless `text` near-duplicates a kept chunk."""
+        if len(text) < self._min_chars:
+            return True
+        fp    = simhash(text)
+        bands = [(b, (fp >> (b * _BAND_BITS)) & _BAND_MASK) for b in range(_BANDS)]
+        for key in bands:
+            for other in self._buckets.get(key, ()):
+                if (fp ^ other).bit_count() <= self._max_distance:
+                    self.dropped += 1
+                    return False
+        for key in bands:
+            self._buckets[key].append(fp)
+        return True
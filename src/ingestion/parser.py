@@ -14,32 +14,45 @@ Key fixes over v3:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from sys import intern
+from typing import Iterator, Optional
 
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
 
+import src.config as cfg
 from src.exceptions import ParsingError
 from src.logger import get_logger
 
 log = get_logger("Parser")
 
 # ── Compiled patterns ─────────────────────────────────────────────────────────
+# Anchored patterns are only tried when the line's first char can match:
+# "(" for recitals/subpoints, a digit for points (str.isdecimal == \d).
 _RE_RECITAL   = re.compile(r'^\(\s*(\d{1,3})\s*\)\s+\S')          # (1) text…
-_RE_CHAPTER   = re.compile(r'^CHAPTER\s+([IVX]+)\s*$', re.I)
-_RE_SECTION   = re.compile(r'^Section\s+(\d+)\s*$', re.I)
-_RE_ARTICLE   = re.compile(r'^Article\s+(\d+)\s*$', re.I)
 _RE_POINT     = re.compile(r'^(\d+)\.\s+\S')                        # "1. Text…"
 _RE_SUBPOINT  = re.compile(r'^\(([a-z])\)\s+\S')                    # "(a) text…"
 
+# CHAPTER / Section / Article headings in one match — dispatch on .lastgroup
+_RE_HEADING = re.compile(
+    r'^(?:CHAPTER\s+(?P<chapter>[IVX]+)'
+    r'|Section\s+(?P<section>\d+)'
+    r'|Article\s+(?P<article>\d+))\s*$',
+    re.I,
+)
+_HEADING_FIRST = frozenset("CSAcsa")
+
 # Lines to skip entirely
 _RE_SKIP = re.compile(
     r'^(L\s+\d+/|EN\s+Official|4\.5\.2016|OJ\s+[CL]|\d+\s*$)',
     re.I,
 )
 
+# Chapter numerals → arabic. Other structural ids ("1", "a", …) are interned
+# in parse(), so the thousands of chunks repeating them share one str each.
 _ROMAN = {
     "I": "1", "II": "2", "III": "3", "IV": "4", "V": "5",
     "VI": "6", "VII": "7", "VIII": "8", "IX": "9", "X": "10",
@@ -48,7 +61,7 @@ _ROMAN = {
 
 
 # ── Data model ────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class _Ctx:
     """Mutable parse context shared across lines."""
     in_recitals: bool = True
@@ -60,8 +73,9 @@ class _Ctx:
     section_chapter: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LegalChunk:
+    """`content` is built from stripped, non-empty lines — never needs re-stripping."""
     content:  str
     page:     int
     recital:  Optional[str] = None
@@ -106,64 +120,97 @@ class LegalChunk:
             "level":          self.level,
             "reference_path": self.reference_path,
         }
-        for attr in ("recital", "chapter", "section", "article", "point", "subpoint"):
-            val = getattr(self, attr)
+        for attr, val in zip(_REF_FIELDS, _get_refs(self)):
             if val is not None:
                 meta[attr] = val
-        return Document(page_content=self.content.strip(), metadata=meta)
+        return Document(page_content=self.content, metadata=meta)
+
+
+# optional structural refs copied into metadata — one C-level getter for all six
+_REF_FIELDS = ("recital", "chapter", "section", "article", "point", "subpoint")
+_get_refs   = attrgetter(*_REF_FIELDS)
+
+_GRANULARITIES = ("article", "point", "subpoint")   # coarse → fine
 
 
 # ── Parser ────────────────────────────────────────────────────────────────────
 class GDPRParser:
     """
     Deterministic, regex-only hierarchical parser for the GDPR CELEX PDF.
-    Produces one LegalChunk per structural unit.
+    Produces one LegalChunk per structural unit, down to `granularity`;
+    finer units are kept as text of their parent chunk.
     """
 
+    def __init__(self, granularity: str = cfg.CHUNK_GRANULARITY) -> None:
+        if granularity not in _GRANULARITIES:
+            raise ParsingError(
+                f"Unknown chunk granularity '{granularity}' — expected one of {_GRANULARITIES}"
+            )
+        self._split_points    = granularity != "article"
+        self._split_subpoints = granularity == "subpoint"
+
     def parse(self, pdf_path: str | Path) -> list[LegalChunk]:
-        try:
-            pages = PyPDFLoader(str(pdf_path)).load()
-        except Exception as exc:
-            raise ParsingError(f"Cannot load PDF '{pdf_path}': {exc}") from exc
+        chunks = list(self._iter_chunks(pdf_path))
+        log.info(f"Parsed {len(chunks)} chunks from '{pdf_path}'")
+        return chunks
+
+    def iter_documents(self, pdf_path: str | Path) -> Iterator[Document]:
+        """
+        Streaming variant of parse() for ingestion: yields Documents as
+        chunks complete, so LegalChunks never accumulate in a list.
+        """
+        for chunk in self._iter_chunks(pdf_path):
+            yield chunk.to_document()
 
-        chunks: list[LegalChunk] = []
+    # ── private ───────────────────────────────────────────────────────────────
+    def _iter_chunks(self, pdf_path: str | Path) -> Iterator[LegalChunk]:
+        chunks: list[LegalChunk] = []   # completed on the current page
         current: Optional[LegalChunk] = None
+        tail: list[str] = []      # continuation lines of `current`, joined once on flush
         ctx = _Ctx()
 
         def _flush() -> None:
             nonlocal current
-            if current and current.content.strip():
+            if current and tail:
+                current.content += "".join(tail)
+            tail.clear()
+            if current:
                 chunks.append(current)
             current = None
 
-        for page_doc in pages:
+        # pages stream in one at a time; each is dropped once its lines are consumed
+        for page_doc in _iter_pages(pdf_path):
             page_num: int = page_doc.metadata.get("page", 0)
             for raw_line in page_doc.page_content.splitlines():
                 line = raw_line.strip()
                 if not line or _RE_SKIP.match(line):
                     continue
 
+                # headings start with C/S/A — most prose lines skip the regex
+                head = _RE_HEADING.match(line) if line[0] in _HEADING_FIRST else None
+                kind = head.lastgroup if head else None
+
                 # ── Exit recital phase on first CHAPTER heading ───────────────
-                if ctx.in_recitals and _RE_CHAPTER.match(line):
+                if ctx.in_recitals and kind == "chapter":
                     ctx.in_recitals = False
 
                 # ── RECITAL ───────────────────────────────────────────────────
                 if ctx.in_recitals:
-                    m = _RE_RECITAL.match(line)
+                    m = _RE_RECITAL.match(line) if line[0] == "(" else None
                     if m:
                         _flush()
                         current = LegalChunk(
-                            content=line, page=page_num, recital=m.group(1)
+                            content=line, page=page_num, recital=intern(m.group(1))
                         )
                     elif current:
-                        current.content += " " + line
+                        tail.append(" " + line)
                     continue
 
                 # ── CHAPTER ───────────────────────────────────────────────────
-                m = _RE_CHAPTER.match(line)
-                if m:
+                if kind == "chapter":
                     _flush()
-                    ctx.chapter  = _ROMAN.get(m.group(1).upper(), m.group(1))
+                    num = head.group("chapter")
+                    ctx.chapter  = _ROMAN.get(num.upper()) or intern(num)
                     ctx.section  = None
                     ctx.article  = None
                     ctx.point    = None
@@ -174,10 +221,9 @@ class GDPRParser:
                     continue
 
                 # ── SECTION ───────────────────────────────────────────────────
-                m = _RE_SECTION.match(line)
-                if m:
+                if kind == "section":
                     _flush()
-                    ctx.section  = m.group(1)
+                    ctx.section  = intern(head.group("section"))
                     ctx.article  = None
                     ctx.point    = None
                     ctx.section_chapter = ctx.chapter
@@ -188,10 +234,9 @@ class GDPRParser:
                     continue
 
                 # ── ARTICLE ───────────────────────────────────────────────────
-                m = _RE_ARTICLE.match(line)
-                if m:
+                if kind == "article":
                     _flush()
-                    ctx.article = m.group(1)
+                    ctx.article = intern(head.group("article"))
                     ctx.point   = None
                     # section only carried if same chapter
                     sec = ctx.section if ctx.section_chapter == ctx.chapter else None
@@ -202,11 +247,11 @@ class GDPRParser:
                     continue
 
                 # ── POINT (only inside an article) ────────────────────────────
-                if ctx.article:
-                    m = _RE_POINT.match(line)
+                if ctx.article and self._split_points:
+                    m = _RE_POINT.match(line) if line[0].isdecimal() else None
                     if m:
                         _flush()
-                        ctx.point = m.group(1)
+                        ctx.point = intern(m.group(1))
                         sec = ctx.section if ctx.section_chapter == ctx.chapter else None
                         current = LegalChunk(
                             content=line, page=page_num,
@@ -216,8 +261,8 @@ class GDPRParser:
                         continue
 
                 # ── SUBPOINT (only inside a point) ────────────────────────────
-                if ctx.point:
-                    m = _RE_SUBPOINT.match(line)
+                if ctx.point and self._split_subpoints:
+                    m = _RE_SUBPOINT.match(line) if line[0] == "(" else None
                     if m:
                         _flush()
                         sec = ctx.section if ctx.section_chapter == ctx.chapter else None
@@ -225,14 +270,24 @@ class GDPRParser:
                             content=line, page=page_num,
                             chapter=ctx.chapter, section=sec,
                             article=ctx.article, point=ctx.point,
-                            subpoint=m.group(1),
+                            subpoint=intern(m.group(1)),
                         )
                         continue
 
                 # ── continuation ──────────────────────────────────────────────
                 if current:
-                    current.content += "\n" + line
+                    tail.append("\n" + line)
+
+            # hand over what this page completed
+            yield from chunks
+            chunks.clear()
 
         _flush()
-        log.info(f"Parsed {len(chunks)} chunks from '{pdf_path}'")
-        return chunks
+        yield from chunks
+
+
+def _iter_pages(pdf_path: str | Path) -> Iterator[Document]:
+    try:
+        yield from PyPDFLoader(str(pdf_path)).lazy_load()
+    except Exception as exc:
+        raise ParsingError(f"Cannot load PDF '{pdf_path}': {exc}") from exc
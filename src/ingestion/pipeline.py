@@ -9,24 +9,40 @@ Changes from v4.1:
 - run() now scans entire DATA_DIR when no path given
 - Deduplication by file SHA-256: re-ingest only if file changed
 - source_file + source_hash added to every Document metadata
+- Multiple PDFs are parsed in parallel across INGEST_WORKERS processes
+- Split Documents are cached on disk per (file hash, chunking config);
+  an unchanged PDF is loaded from SPLIT_CACHE_DIR instead of re-parsed
+- Near-duplicate chunks (repeated boilerplate) are dropped via SimHash
 """
 
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import orjson
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 import src.config as cfg
 from src.exceptions import IngestionError
+from src.ingestion.dedup import NearDuplicateFilter
 from src.ingestion.parser import GDPRParser
 from src.logger import get_logger
 
 log = get_logger("Ingestion")
 
+# bump whenever parser/splitter output changes for the same input + config
+_SPLIT_CACHE_VERSION = 2
+
+# builds splitters off the caller's thread (thread starts on first submit)
+_WARMUP = ThreadPoolExecutor(max_workers=1, thread_name_prefix="splitter-warmup")
+
 
 def _sha256(path: Path) -> str:
     h = hashlib.sha256()
@@ -36,15 +52,42 @@ def _sha256(path: Path) -> str:
     return h.hexdigest()[:16]   # first 16 chars, enough for dedup
 
 
+@lru_cache(maxsize=4)
+def _splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    tokenizer: Optional[str] = None,
+) -> RecursiveCharacterTextSplitter:
+    """
+    One splitter per config, shared by every pipeline in the process.
+    With `tokenizer`, sizes are counted in that model's tokens, not chars.
+    """
+    kwargs = dict(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n\n", "\n", ". ", " "],
+    )
+    if tokenizer is None:
+        return RecursiveCharacterTextSplitter(**kwargs)
+    from transformers import AutoTokenizer
+    return RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+        AutoTokenizer.from_pretrained(tokenizer), **kwargs
+    )
+
+
 class IngestionPipeline:
 
     def __init__(self) -> None:
         self._parser = GDPRParser()
-        self._splitter = RecursiveCharacterTextSplitter(
-            chunk_size=cfg.CHUNK_SIZE,
-            chunk_overlap=cfg.CHUNK_OVERLAP,
-            separators=["\n\n", "\n", ". ", " "],
-        )
+        if cfg.CHUNK_TOKENS:
+            self._max_len = cfg.CHUNK_TOKENS
+            args = (cfg.CHUNK_TOKENS, cfg.CHUNK_OVERLAP_TOKENS, cfg.EMBEDDING_MODEL)
+        else:
+            self._max_len = cfg.CHUNK_SIZE
+            args = (cfg.CHUNK_SIZE, cfg.CHUNK_OVERLAP)
+        # Token mode loads a HF tokenizer — build in the background so it
+        # overlaps with PDF parsing; joined on the first oversize chunk
+        self._splitter_ready = _WARMUP.submit(_splitter, *args)
 
     # ── public ────────────────────────────────────────────────────────────────
     def run(self, pdf_path: Optional[str | Path] = None) -> list[Document]:
@@ -61,22 +104,67 @@ class IngestionPipeline:
         if not paths:
             raise IngestionError(f"No PDF files found in {cfg.DATA_DIR}")
 
+        dedup = NearDuplicateFilter() if cfg.DEDUP_CHUNKS else None
         all_docs: list[Document] = []
+        for path, outcome in self._ingest_all(paths):
+            if isinstance(outcome, Exception):
+                log.error(f"  {path.name}: FAILED — {outcome}")
+                continue   # continue with remaining PDFs, don't abort whole run
+            if dedup is not None:
+                outcome = [d for d in outcome if dedup.is_new(d.page_content)]
+            all_docs.extend(outcome)
+            log.info(f"  {path.name}: {len(outcome)} chunks")
+
+        if not all_docs:
+            raise IngestionError("All PDFs failed to ingest")
+
+        dropped = dedup.dropped if dedup is not None else 0
+        log.info(
+            f"Ingestion complete: {len(paths)} PDFs → {len(all_docs)} total chunks "
+            f"({dropped} near-duplicates dropped)"
+        )
+        return all_docs
+
+    def stream(
+        self,
+        pdf_path: Optional[str | Path] = None,
+        batch_size: int = 256,
+    ) -> Iterator[list[Document]]:
+        """
+        Like run(), but yields split + stamped Documents in batches as each
+        PDF completes, so a consumer (e.g. an embedder) can start before
+        the whole corpus is parsed. Serial, in-process.
+
+        Produces the same corpus as run(): each PDF is buffered until it
+        parses cleanly, so a PDF that fails mid-parse contributes nothing.
+        Memory stays at one PDF's chunks plus one batch.
+        """
+        paths = self._collect_paths(pdf_path)
+        if not paths:
+            raise IngestionError(f"No PDF files found in {cfg.DATA_DIR}")
+
+        dedup = NearDuplicateFilter() if cfg.DEDUP_CHUNKS else None
+        batch: list[Document] = []
+        total = 0
         for path in paths:
             try:
                 docs = self._ingest_one(path)
-                all_docs.extend(docs)
-                log.info(f"  {path.name}: {len(docs)} chunks")
             except Exception as exc:
                 log.error(f"  {path.name}: FAILED — {exc}")
-                # continue with remaining PDFs, don't abort whole run
-
-        if not all_docs:
+                continue
+            if dedup is not None:
+                docs = [d for d in docs if dedup.is_new(d.page_content)]
+            total += len(docs)
+            for doc in docs:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+        if not total:
             raise IngestionError("All PDFs failed to ingest")
 
-        log.info(f"Ingestion complete: {len(paths)} PDFs → {len(all_docs)} total chunks")
-        return all_docs
-
     # ── private ───────────────────────────────────────────────────────────────
     def _collect_paths(self, pdf_path: Optional[str | Path]) -> list[Path]:
         if pdf_path:
@@ -90,29 +178,106 @@ class IngestionPipeline:
         log.info(f"Found {len(paths)} PDF(s) in {cfg.DATA_DIR}")
         return paths
 
+    def _ingest_all(
+        self, paths: list[Path]
+    ) -> Iterator[tuple[Path, list[Document] | Exception]]:
+        """(path, docs or the exception it raised), in input order."""
+        workers = min(cfg.INGEST_WORKERS, len(paths))
+        if workers <= 1:
+            for path in paths:
+                try:
+                    yield path, self._ingest_one(path)
+                except Exception as exc:
+                    yield path, exc
+            return
+
+        # Parsing + splitting is CPU-bound Python — one process per PDF.
+        # spawn, not fork: the API process already runs threads (embedding
+        # batcher, retrieval fan-out) and forking those is unsafe.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = [(path, pool.submit(_ingest_path, path)) for path in paths]
+            for path, fut in futures:
+                try:
+                    yield path, fut.result()
+                except Exception as exc:
+                    yield path, exc
+
     def _ingest_one(self, path: Path) -> list[Document]:
-        log.info(f"Ingesting: {path.name}")
+        if not cfg.SPLIT_CACHE:
+            return list(self._iter_one(path))
+
         file_hash = _sha256(path)
+        cache = cfg.SPLIT_CACHE_DIR / f"{file_hash}-{self._config_key()}.json"
+        docs = _load_split_cache(cache)
+        if docs is not None:
+            # cache is keyed on content — a renamed/copied PDF must carry its own name
+            for doc in docs:
+                doc.metadata["source_file"] = path.name
+            log.info(f"  {path.name}: loaded {len(docs)} chunks from split cache")
+            return docs
+
+        docs = list(self._iter_one(path, file_hash))
+        _save_split_cache(cache, docs)
+        return docs
 
-        chunks  = self._parser.parse(path)
-        docs    = [c.to_document() for c in chunks]
-        final   = self._split_large(docs)
+    def _config_key(self) -> str:
+        """Short digest of every setting that changes the split output."""
+        params = (
+            _SPLIT_CACHE_VERSION, cfg.CHUNK_GRANULARITY,
+            cfg.CHUNK_TOKENS, cfg.CHUNK_OVERLAP_TOKENS, cfg.CHUNK_SIZE, cfg.CHUNK_OVERLAP,
+            cfg.EMBEDDING_MODEL if cfg.CHUNK_TOKENS else "",
+        )
+        return hashlib.blake2b(repr(params).encode(), digest_size=8).hexdigest()
 
-        # Stamp every chunk with its source so answers can be attributed
-        for doc in final:
+    def _iter_one(self, path: Path, file_hash: Optional[str] = None) -> Iterator[Document]:
+        """parser → splitter → stamp, one lazy stream per PDF."""
+        log.info(f"Ingesting: {path.name}")
+        file_hash = file_hash or _sha256(path)
+        for seq, doc in enumerate(self._split_large(self._parser.iter_documents(path))):
+            # Stamp every chunk with its source so answers can be attributed
             doc.metadata["source_file"] = path.name
             doc.metadata["source_hash"] = file_hash
+            # unique + stable across re-ingests of the same file; splits of one
+            # oversize unit share reference_path, so that can't identify a chunk
+            doc.metadata["chunk_id"] = f"{file_hash}:{seq}"
+            yield doc
 
-        return final
-
-    def _split_large(self, docs: list[Document]) -> list[Document]:
-        result: list[Document] = []
+    def _split_large(self, docs: Iterable[Document]) -> Iterator[Document]:
         for doc in docs:
-            if len(doc.page_content) > cfg.CHUNK_SIZE:
-                splits = self._splitter.split_documents([doc])
-                for s in splits:
-                    s.metadata = dict(doc.metadata)
-                result.extend(splits)
+            # len() in chars is a safe pre-check in token mode too: every
+            # token spans at least one char, so ≤ N chars means ≤ N tokens
+            if len(doc.page_content) > self._max_len:
+                # split_text, not split_documents: the latter deep-copies the
+                # metadata per split; a shallow copy is enough (flat scalars)
+                meta = doc.metadata
+                for text in self._splitter_ready.result().split_text(doc.page_content):
+                    yield Document(page_content=text, metadata=dict(meta))
             else:
-                result.append(doc)
-        return result
+                yield doc
+
+
+def _load_split_cache(path: Path) -> Optional[list[Document]]:
+    try:
+        rows = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        log.warning(f"Split cache unreadable ({exc}) — re-parsing")
+        return None
+    return [Document(page_content=text, metadata=meta) for text, meta in rows]
+
+
+def _save_split_cache(path: Path, docs: list[Document]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")   # pool workers may race
+        tmp.write_bytes(orjson.dumps([(d.page_content, d.metadata) for d in docs]))
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.warning(f"Split cache not written ({exc})")
+
+
+def _ingest_path(path: Path) -> list[Document]:
+    """Process-pool entry point — module level so it pickles by reference."""
+    return IngestionPipeline()._ingest_one(path)
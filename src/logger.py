@@ -1,13 +1,18 @@
 """
 Logging — rotating file + console, one call to get_logger().
+
+Loggers only enqueue records; a background QueueListener does the
+formatting, file writes and rotation checks off the request threads.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import src.config as cfg
 
@@ -18,20 +23,70 @@ _FMT_FILE    = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 _FMT_CONSOLE = "%(levelname)-8s | %(name)s | %(message)s"
 
 
-def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    if logger.handlers:
-        return logger
-
-    logger.setLevel(logging.INFO)
-
+def _build_handlers() -> tuple[logging.Handler, ...]:
     fh = RotatingFileHandler(_LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8")
     fh.setFormatter(logging.Formatter(_FMT_FILE))
 
     ch = logging.StreamHandler(sys.stdout)
     ch.setFormatter(logging.Formatter(_FMT_CONSOLE))
+    return fh, ch
+
+
+# Built once per process and shared by every logger — one file handle and one
+# rotation check per record, instead of a RotatingFileHandler per module all
+# appending to (and trying to rotate) the same app.log.
+_HANDLERS = _build_handlers()
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Enqueue the record untouched. The stock prepare() runs self.format()
+    (message %-merge + traceback) on the caller's thread; here the
+    listener's handlers do all formatting. Log args must not be mutated
+    after the call — hot paths only pass ints, floats and strings.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Producers put records on a lock-free SimpleQueue; only the listener thread
+# touches the handlers.
+_QUEUE_H = _DeferredQueueHandler(queue.SimpleQueue())
+
 
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+def _start_listener() -> QueueListener:
+    _QUEUE_H.queue = queue.SimpleQueue()   # never reuse a queue across fork()
+    listener = QueueListener(_QUEUE_H.queue, *_HANDLERS, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _restart_listener() -> None:
+    # gunicorn preload_app forks workers after import: threads don't survive
+    # fork, so each child needs its own listener or its records are never written
+    global _LISTENER
+    _LISTENER = _start_listener()
+
+
+def _stop_listener() -> None:
+    _LISTENER.stop()   # drains whatever is still queued
+
+
+_LISTENER = _start_listener()
+os.register_at_fork(after_in_child=_restart_listener)
+atexit.register(_stop_listener)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Log hot paths %-style — log.info("x=%d", x) — so the message is only
+    formatted when a handler actually emits it.
+    """
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.INFO)
+    logger.addHandler(_QUEUE_H)
     logger.propagate = False
     return logger
@@ -6,12 +6,12 @@ Now tracks prompt_version per call for eval correlation.
 
 from __future__ import annotations
 
-import json
-import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
 import src.config as cfg
 from src.logger import get_logger
 
@@ -50,10 +50,11 @@ class LLMTracker:
             error=error,
         )
         self._calls.append(call)
-        with open(_LOG_FILE, "a", encoding="utf-8") as fh:
-            fh.write(json.dumps(asdict(call)) + "\n")
+        # orjson serialises the dataclass directly — no asdict() deep copy
+        with open(_LOG_FILE, "ab") as fh:
+            fh.write(orjson.dumps(call, option=orjson.OPT_APPEND_NEWLINE))
         if success:
-            log.info(f"LLM call: {latency_ms:.0f} ms | prompt_v={prompt_version}")
+            log.info("LLM call: %.0f ms | prompt_v=%s", latency_ms, prompt_version)
         else:
             log.error(f"LLM call failed: {error}")
 
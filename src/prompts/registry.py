@@ -20,7 +20,6 @@ Usage:
 
 from __future__ import annotations
 
-from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -32,8 +31,6 @@ from src.logger import get_logger
 
 log = get_logger("PromptRegistry")
 
-_PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
-
 
 class PromptConfig:
     """Parsed prompt YAML with convenience accessors."""
@@ -89,7 +86,7 @@ class PromptRegistry:
     """
 
     def __init__(self, prompts_dir: Optional[Path] = None) -> None:
-        self._dir = prompts_dir or _PROMPTS_DIR
+        self._dir = prompts_dir or cfg.PROMPTS_DIR
         self._prompts: dict[str, PromptConfig] = {}
         self._load_all()
 
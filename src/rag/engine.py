@@ -9,31 +9,47 @@ RAG Engine  (v4.2)
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator, NamedTuple
 
 from langchain.chains import create_retrieval_chain
 from langchain.chains.combine_documents import create_stuff_documents_chain
-from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_community.vectorstores import FAISS
-from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_openai import ChatOpenAI
 
 import src.config as cfg
+from src.caching.answer_cache import SemanticAnswerCache
+from src.caching.embedding_cache import CachedEmbeddings
 from src.caching.query_cache import QueryCache
 from src.exceptions import RAGEngineError
-from src.guardrails.safety import SafetyGuardrails
+from src.guardrails.safety import SafetyGuardrails, StreamingOutputGuard
 from src.logger import get_logger
 from src.monitoring.tracker import LLMTracker
 from src.prompts.registry import PromptRegistry
+from src.rag.sessions import BoundedChatHistory, SessionStore
 from src.retrieval.bm25_index import BM25Index
 from src.retrieval.retriever import SmartRetriever
 
 log = get_logger("RAGEngine")
 
+# history + user turn are identical for every prompt version — build them once;
+# only the system message (versioned YAML template) varies per chain
+_CHAT_TURN = (
+    MessagesPlaceholder("chat_history"),
+    ("human", "{input}"),
+)
+
 
 # ── LangChain retriever adapter ───────────────────────────────────────────────
 class _RetrieverAdapter(BaseRetriever):
@@ -46,7 +62,17 @@ class _RetrieverAdapter(BaseRetriever):
         run_manager: CallbackManagerForRetrieverRun | None = None,
     ) -> list[Document]:
         docs, analysis = self.smart.retrieve(query)
-        log.info(f"Retrieved {len(docs)} docs | {analysis.intent.value}")
+        log.info("Retrieved %d docs | %s", len(docs), analysis.intent.value)
+        return docs
+
+    async def _aget_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: AsyncCallbackManagerForRetrieverRun | None = None,
+    ) -> list[Document]:
+        docs, analysis = await self.smart.aretrieve(query)
+        log.info("Retrieved %d docs | %s", len(docs), analysis.intent.value)
         return docs
 
 
@@ -56,17 +82,21 @@ class RAGEngine:
     def __init__(self, vectorstore: FAISS, bm25: BM25Index) -> None:
         log.info("Initialising RAG Engine…")
         try:
-            self._registry  = PromptRegistry()
-            self._retriever = SmartRetriever(vectorstore, bm25)
-            self._safety    = SafetyGuardrails()
-            self._cache     = QueryCache()
-            self._tracker   = LLMTracker()
-            self._sessions: dict[str, ChatMessageHistory] = {}
-            log.info(
-                f"RAG Engine ready | "
-                f"prompt={self._registry.get().version} | "
-                f"model={self._registry.get().model}"
-            )
+            self._registry   = PromptRegistry()
+            self._retriever  = SmartRetriever(vectorstore, bm25)
+            self._embeddings = vectorstore.embeddings
+            self._safety     = SafetyGuardrails()
+            self._cache      = QueryCache()
+            self._answers    = SemanticAnswerCache()
+            self._tracker    = LLMTracker()
+            self._sessions   = SessionStore()
+            # one chain per prompt version — only session_id varies per call
+            self._chains:   dict[str, RunnableWithMessageHistory] = {}
+            self._chains_lock = threading.Lock()
+            # build the active version's chain now, so the first /chat doesn't pay for it
+            active = self._registry.get()
+            self._chain(active)
+            log.info(f"RAG Engine ready | prompt={active.version} | model={active.model}")
         except Exception as exc:
             raise RAGEngineError(f"Engine init failed: {exc}") from exc
 
@@ -77,66 +107,237 @@ class RAGEngine:
         session_id: str = "default",
         prompt_version: str | None = None,
     ) -> dict:
+        # 1-4. Safety, caches, off-topic, prompt
+        prep = self._prepare(query, prompt_version)
+        if prep.early is not None:
+            return prep.early
+
+        # 5. Chain (cached per prompt version) + invoke
+        try:
+            chain = self._chain(prep.prompt_cfg)
+            t0 = time.perf_counter()
+            result = chain.invoke(
+                {"input": query},
+                config={"configurable": {"session_id": session_id}},
+            )
+            latency = (time.perf_counter() - t0) * 1000
+            self._tracker.record(latency_ms=latency, prompt_version=prep.prompt_cfg.version)
+        except Exception as exc:
+            log.error(f"Chain error: {exc}", exc_info=True)
+            self._tracker.record(latency_ms=0, success=False, error=str(exc))
+            raise RAGEngineError(f"Query failed: {exc}") from exc
+
+        # 6-7. Output safety, cache
+        return self._finalize(query, prep, result)
+
+    async def aquery(
+        self,
+        query: str,
+        session_id: str = "default",
+        prompt_version: str | None = None,
+    ) -> dict:
+        """
+        Async variant of query(): the LLM call is awaited on the event loop
+        (chain.ainvoke) instead of parking a thread for its network wait.
+        """
+        prep = await asyncio.to_thread(self._prepare, query, prompt_version)
+        if prep.early is not None:
+            return prep.early
+
+        try:
+            chain = self._chain(prep.prompt_cfg)
+            t0 = time.perf_counter()
+            result = await chain.ainvoke(
+                {"input": query},
+                config={"configurable": {"session_id": session_id}},
+            )
+            latency = (time.perf_counter() - t0) * 1000
+            self._tracker.record(latency_ms=latency, prompt_version=prep.prompt_cfg.version)
+        except Exception as exc:
+            log.error(f"Chain error: {exc}", exc_info=True)
+            self._tracker.record(latency_ms=0, success=False, error=str(exc))
+            raise RAGEngineError(f"Query failed: {exc}") from exc
+
+        return self._finalize(query, prep, result)
+
+    async def abatch_query(
+        self,
+        queries: list[tuple[str, str]],
+        prompt_version: str | None = None,
+    ) -> list[dict | Exception]:
+        """
+        Answer many (query, session_id) pairs concurrently — at most
+        LLM_CONCURRENCY LLM calls in flight. Results keep input order; a
+        failed query yields its exception instead of failing the batch.
+        """
+        gate = asyncio.Semaphore(cfg.LLM_CONCURRENCY)
+
+        async def _one(query: str, session_id: str) -> dict:
+            async with gate:
+                return await self.aquery(query, session_id, prompt_version)
+
+        return await asyncio.gather(
+            *(_one(q, sid) for q, sid in queries),
+            return_exceptions=True,
+        )
+
+    async def astream(
+        self,
+        query: str,
+        session_id: str = "default",
+        prompt_version: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Streaming variant of query().
+
+        Yields {"delta": str} for each answer token as the LLM produces it,
+        then exactly one {"result": dict} with the same shape query() returns.
+
+        Deltas pass through StreamingOutputGuard first: a prompt-leak marker
+        is never emitted, and the stream stops as soon as one appears. The
+        held-back tail is only released once the full answer passes the
+        same output check query() applies.
+        """
+        prep = await asyncio.to_thread(self._prepare, query, prompt_version)
+        if prep.early is not None:
+            yield {"delta": prep.early.get("answer", "")}
+            yield {"result": prep.early}
+            return
+
+        guard = StreamingOutputGuard()
+        parts:   list[str]      = []
+        context: list[Document] = []
+        try:
+            chain = self._chain(prep.prompt_cfg)
+            t0 = time.perf_counter()
+            stream = chain.astream(
+                {"input": query},
+                config={"configurable": {"session_id": session_id}},
+            )
+            async with aclosing(stream):
+                async for chunk in stream:
+                    if "context" in chunk:
+                        context = chunk["context"]
+                    if chunk.get("answer"):
+                        parts.append(chunk["answer"])
+                        if safe := guard.feed(chunk["answer"]):
+                            yield {"delta": safe}
+                        elif guard.blocked:
+                            break   # _finalize below swaps in the refusal
+            latency = (time.perf_counter() - t0) * 1000
+            self._tracker.record(latency_ms=latency, prompt_version=prep.prompt_cfg.version)
+        except Exception as exc:
+            log.error(f"Chain error: {exc}", exc_info=True)
+            self._tracker.record(latency_ms=0, success=False, error=str(exc))
+            raise RAGEngineError(f"Query failed: {exc}") from exc
+
+        result = {"input": query, "context": context, "answer": "".join(parts)}
+        final  = self._finalize(query, prep, result)
+        # _finalize hands back `result` itself only when check_output passed
+        if final is result and (tail := guard.tail()):
+            yield {"delta": tail}
+        yield {"result": final}
+
+    def get_cached_embedding(self, query: str) -> list[float]:
+        """Query embedding via the shared LRU — same vector FAISS search uses."""
+        return self._embeddings.embed_query(query)
+
+    def clear_caches(self) -> None:
+        """Drop cached answers — call whenever the indexed corpus changes."""
+        self._cache.clear()
+        self._answers.clear()
+
+    def last_turn(self, session_id: str) -> tuple[str, str] | None:
+        """The session's newest (question, answer) turn, if it has one."""
+        return self._sessions.last_turn(session_id)
+
+    def cache_stats(self) -> dict:
+        stats: dict = {
+            "query_cache":  {"size": len(self._cache),   "max_size": self._cache.max_size},
+            "answer_cache": {"size": len(self._answers), "max_size": self._answers.max_size},
+        }
+        if isinstance(self._embeddings, CachedEmbeddings):
+            stats["embedding_cache"] = self._embeddings.cache_info()
+        return stats
+
+    @property
+    def tracker(self) -> LLMTracker:
+        return self._tracker
+
+    @property
+    def answer_cache(self) -> SemanticAnswerCache:
+        return self._answers
+
+    @property
+    def prompt_registry(self) -> PromptRegistry:
+        return self._registry
+
+    # ── private ───────────────────────────────────────────────────────────────
+    def _prepare(self, query: str, prompt_version: str | None) -> _Prepared:
+        """Everything before the LLM call. Sets .early when no LLM call is needed."""
         # 1. Input safety
         safe, reason = self._safety.check(query)
         if not safe:
             log.warning(f"Blocked: {reason}")
-            return {"answer": "I can only answer questions about GDPR.", "context": [], "prompt_version": "N/A"}
+            return _Prepared(early=_refusal())
 
         # 2. Cache
         cached = self._cache.get(query)
         if cached:
             log.info("Cache HIT")
-            return cached
+            return _Prepared(early=cached)
 
         # 3. Off-topic
         analysis = self._retriever._analyzer.analyze(query)
         if analysis.confidence < 0.2:
-            return {"answer": "I can only answer questions about GDPR.", "context": [], "prompt_version": "N/A"}
+            return _Prepared(early=_refusal())
 
         # 4. Load prompt
         prompt_cfg = self._registry.get(prompt_version)
-        llm = ChatOpenAI(
-            model=prompt_cfg.model,
-            temperature=prompt_cfg.temperature,
-            api_key=cfg.OPENAI_API_KEY,
-        )
 
-        # 5. Build chain + invoke
-        try:
-            chain = self._build_chain(llm, prompt_cfg)
-            t0 = time.perf_counter()
-            result = chain.invoke(
-                {"input": query},
-                config={"configurable": {"session_id": session_id}},
-            )
-            latency = (time.perf_counter() - t0) * 1000
-            self._tracker.record(latency_ms=latency, prompt_version=prompt_cfg.version)
-        except Exception as exc:
-            log.error(f"Chain error: {exc}", exc_info=True)
-            self._tracker.record(latency_ms=0, success=False, error=str(exc))
-            raise RAGEngineError(f"Query failed: {exc}") from exc
+        # 4b. Semantic cache — near-duplicate question, same prompt + refs
+        scope  = _answer_scope(prompt_cfg.version, analysis.filter_dict())
+        q_vec  = self.get_cached_embedding(query)
+        cached = self._answers.get(q_vec, scope)
+        if cached:
+            return _Prepared(early=cached)
+
+        return _Prepared(prompt_cfg=prompt_cfg, scope=scope, q_vec=q_vec)
 
+    def _finalize(self, query: str, prep: _Prepared, result: dict) -> dict:
         # 6. Output safety
         answer = result.get("answer", "")
         if not self._safety.check_output(answer):
             log.error("Unsafe output suppressed")
-            return {"answer": "Unable to generate a safe response.", "context": [], "prompt_version": prompt_cfg.version}
+            return {"answer": "Unable to generate a safe response.", "context": [], "prompt_version": prep.prompt_cfg.version}
 
         # 7. Attach prompt version to result, cache, return
-        result["prompt_version"] = prompt_cfg.version
+        result["prompt_version"] = prep.prompt_cfg.version
         self._cache.set(query, result)
+        self._answers.add(prep.q_vec, prep.scope, result)
         return result
 
-    @property
-    def tracker(self) -> LLMTracker:
-        return self._tracker
+    def _chain(self, prompt_cfg) -> RunnableWithMessageHistory:
+        chain = self._chains.get(prompt_cfg.version)
+        if chain is not None:
+            return chain
+        # first touch from several /chat threads at once → build exactly once
+        with self._chains_lock:
+            chain = self._chains.get(prompt_cfg.version)
+            if chain is None:
+                chain = self._build_chain(self._llm(prompt_cfg), prompt_cfg)
+                self._chains[prompt_cfg.version] = chain
+                log.info(f"Chain built for prompt v{prompt_cfg.version}")
+        return chain
 
-    @property
-    def prompt_registry(self) -> PromptRegistry:
-        return self._registry
+    @staticmethod
+    def _llm(prompt_cfg) -> ChatOpenAI:
+        return ChatOpenAI(
+            model=prompt_cfg.model,
+            temperature=prompt_cfg.temperature,
+            api_key=cfg.OPENAI_API_KEY,
+        )
 
-    # ── private ───────────────────────────────────────────────────────────────
     def _build_chain(self, llm, prompt_cfg):
         # Inject available source files into prompt
         source_files = self._get_source_files()
@@ -154,13 +355,8 @@ class RAGEngine:
         )
 
     def _build_prompt(self, prompt_cfg, source_files: str):
-        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
         system = prompt_cfg.system_template.replace("{source_files}", source_files)
-        return ChatPromptTemplate.from_messages([
-            ("system", system),
-            MessagesPlaceholder("chat_history"),
-            ("human", "{input}"),
-        ])
+        return ChatPromptTemplate.from_messages([("system", system), *_CHAT_TURN])
 
     def _get_source_files(self) -> str:
         """List unique source_file values from indexed documents."""
@@ -171,7 +367,21 @@ class RAGEngine:
         except Exception:
             return "GDPR EU 2016/679"
 
-    def _get_history(self, session_id: str) -> ChatMessageHistory:
-        if session_id not in self._sessions:
-            self._sessions[session_id] = ChatMessageHistory()
-        return self._sessions[session_id]
+    def _get_history(self, session_id: str) -> BoundedChatHistory:
+        return self._sessions.get_or_create(session_id)
+
+
+class _Prepared(NamedTuple):
+    early:      dict | None        = None
+    prompt_cfg: Any                = None
+    scope:      str                = ""
+    q_vec:      list[float] | None = None
+
+
+def _refusal() -> dict:
+    return {"answer": "I can only answer questions about GDPR.", "context": [], "prompt_version": "N/A"}
+
+
+def _answer_scope(prompt_version: str, refs: dict) -> str:
+    """Semantic-cache partition: answers are only shared within one scope."""
+    return prompt_version + "|" + ",".join(f"{k}={v}" for k, v in sorted(refs.items()))
@@ -0,0 +1,68 @@
+"""
+Session Store
+=============
+Chat history per session_id for RunnableWithMessageHistory, bounded
+two ways so memory stays flat however many users arrive:
+
+  - at most MAX_SESSIONS sessions; the least recently used is evicted
+  - at most MAX_HISTORY_TURNS question/answer turns per session, which
+    also keeps the prompt's chat_history (and its tokens) a fixed size
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from langchain_community.chat_message_histories import ChatMessageHistory
+from langchain_core.messages import BaseMessage
+
+import src.config as cfg
+
+
+class BoundedChatHistory(ChatMessageHistory):
+    """ChatMessageHistory that keeps only the newest `max_messages`."""
+
+    max_messages: int = 0   # 0 = unbounded
+
+    def add_message(self, message: BaseMessage) -> None:
+        super().add_message(message)
+        if self.max_messages and len(self.messages) > self.max_messages:
+            self.messages = self.messages[-self.max_messages:]
+
+
+class SessionStore:
+
+    def __init__(
+        self,
+        max_sessions: int = cfg.MAX_SESSIONS,
+        max_turns:    int = cfg.MAX_HISTORY_TURNS,
+    ) -> None:
+        self._max          = max_sessions
+        self._max_messages = max_turns * 2     # one human + one AI message per turn
+        self._data: OrderedDict[str, BoundedChatHistory] = OrderedDict()
+        self._lock = threading.Lock()          # /chat runs on a thread pool
+
+    def get_or_create(self, session_id: str) -> BoundedChatHistory:
+        with self._lock:
+            history = self._data.get(session_id)
+            if history is not None:
+                self._data.move_to_end(session_id)   # refresh LRU position
+                return history
+            history = BoundedChatHistory(max_messages=self._max_messages)
+            self._data[session_id] = history
+            if len(self._data) > self._max:
+                self._data.popitem(last=False)       # evict least recently used
+            return history
+
+    def last_turn(self, session_id: str) -> tuple[str, str] | None:
+        """(question, answer) of the newest turn, or None — never creates or touches a session."""
+        with self._lock:
+            history = self._data.get(session_id)
+            messages = history.messages[-2:] if history is not None else []
+        if len(messages) < 2 or messages[0].type != "human" or messages[1].type != "ai":
+            return None
+        return messages[0].content, messages[1].content
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -16,7 +16,6 @@ Thread-safe for reads (index is immutable after build).
 
 from __future__ import annotations
 
-import re
 import string
 from typing import Optional
 
@@ -84,7 +83,7 @@ class BM25Index:
             reverse=True,
         )
         results = [doc for score, doc in ranked[:k] if score > 0.0]
-        log.debug(f"BM25 search '{query[:50]}' → {len(results)} results")
+        log.debug("BM25 search '%.50s' → %d results", query, len(results))
         return results
 
     # ── helpers ───────────────────────────────────────────────────────────────
@@ -18,6 +18,8 @@ Why RRF over score normalisation?
 
 from __future__ import annotations
 
+import logging
+
 from langchain_core.documents import Document
 
 from src.logger import get_logger
@@ -41,7 +43,7 @@ def reciprocal_rank_fusion(
 
     Returns:
         Single merged list sorted by fused RRF score (best first).
-        Deduplication is by page_content hash.
+        Deduplication is by chunk_id (see _doc_key).
     """
     scores:   dict[str, float]   = {}
     doc_map:  dict[str, Document] = {}
@@ -63,15 +65,18 @@ def reciprocal_rank_fusion(
             metadata={**doc.metadata, "rrf_score": round(scores[key], 6)},
         ))
 
-    log.debug(
-        f"RRF fused {sum(len(r) for r in ranked_lists)} → {len(result)} unique docs"
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("RRF fused %d → %d unique docs", sum(map(len, ranked_lists)), len(result))
     return result
 
 
 def _doc_key(doc: Document) -> str:
-    """Stable identity key: prefer reference_path, fall back to content hash."""
-    ref = doc.metadata.get("reference_path")
-    if ref:
-        return ref
+    """
+    Stable identity key: chunk_id stamped at ingestion; indexes built before
+    chunk_ids existed fall back to reference_path, then a content hash.
+    """
+    meta = doc.metadata
+    key = meta.get("chunk_id") or meta.get("reference_path")
+    if key:
+        return key
     return str(hash(doc.page_content[:200]))
@@ -17,9 +17,11 @@ Handles all common patterns:
 
 from __future__ import annotations
 
+import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from src.logger import get_logger
@@ -67,7 +69,7 @@ _RE_OFFTOPIC = re.compile(
 
 
 # ── Result dataclass ──────────────────────────────────────────────────────────
-@dataclass
+@dataclass(frozen=True)   # shared between callers via the analyze() cache
 class QueryAnalysis:
     intent:   Intent
     query:    str
@@ -104,8 +106,12 @@ class QueryAnalyzer:
     """
 
     def analyze(self, query: str) -> QueryAnalysis:
-        q = query.strip()
+        return self._analyze(query.strip())
 
+    # pure function of the stripped query — retries and repeats hit the cache
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _analyze(q: str) -> QueryAnalysis:
         # Off-topic check
         if _RE_OFFTOPIC.match(q):
             return QueryAnalysis(intent=Intent.SEMANTIC, query=q, confidence=0.1)
@@ -149,8 +155,9 @@ class QueryAnalyzer:
             article=article, point=point, subpoint=subpoint,
             confidence=confidence,
         )
-        log.info(
-            f"Analyzed | intent={intent.value} conf={confidence:.2f} "
-            f"ref={result.filter_dict()}"
-        )
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "Analyzed | intent=%s conf=%.2f ref=%s",
+                intent.value, confidence, result.filter_dict(),
+            )
         return result
@@ -16,18 +16,25 @@ Model: cross-encoder/ms-marco-MiniLM-L-6-v2
   - Trained on MS MARCO passage ranking — works well for legal Q&A
   - Can be swapped via RERANKER_MODEL env var
 
-Lazy loading: model is downloaded on first use, cached in memory.
+Lazy loading: model is downloaded on first use, cached in memory;
+warmup() forces that (plus one inference) at startup instead.
+With RERANKER_SERVER set, scoring goes to a TEI sidecar and the model is
+never loaded in-process.
 """
 
 from __future__ import annotations
 
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from langchain_core.documents import Document
-from sentence_transformers import CrossEncoder
 
 import src.config as cfg
 from src.logger import get_logger
+from src.vector_store.tei_client import TEIClient
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
 
 log = get_logger("Reranker")
 
@@ -44,11 +51,13 @@ class CrossEncoderReranker:
 
     def __init__(self, model_name: str = cfg.RERANKER_MODEL) -> None:
         self._model_name = model_name
+        self._remote     = TEIClient(cfg.RERANKER_SERVER) if cfg.RERANKER_SERVER else None
         # Don't load model at __init__ — load lazily on first rerank call
         # so startup is fast and model is only in memory when needed.
 
     @cached_property
     def _model(self) -> CrossEncoder:
+        from sentence_transformers import CrossEncoder
         log.info(f"Loading CrossEncoder: {self._model_name}")
         model = CrossEncoder(self._model_name, max_length=512)
         log.info("CrossEncoder ready")
@@ -75,38 +84,52 @@ class CrossEncoderReranker:
         if not candidates:
             return []
 
-        # CrossEncoder needs list of [query, text] pairs
-        pairs = [[query, doc.page_content] for doc in candidates]
-
         try:
-            scores = self._model.predict(pairs)
+            scores = self._score(query, [doc.page_content for doc in candidates])
         except Exception as exc:
             log.error(f"CrossEncoder predict failed: {exc} — falling back to order")
             return candidates[:k]
 
-        # Attach score to each doc's metadata (useful for debugging / tracing)
-        scored: list[tuple[float, Document]] = []
-        for score, doc in zip(scores, candidates):
-            doc_copy = Document(
-                page_content=doc.page_content,
-                metadata={**doc.metadata, "rerank_score": round(float(score), 4)},
-            )
-            scored.append((float(score), doc_copy))
-
         # Sort by score descending
-        scored.sort(key=lambda x: x[0], reverse=True)
+        scored = sorted(zip(map(float, scores), candidates), key=lambda x: x[0], reverse=True)
 
-        top_k = [doc for _, doc in scored[:k]]
+        # Attach score to the kept docs' metadata (useful for debugging / tracing);
+        # copies, so the shared docstore Documents are never mutated
+        top_k = [
+            Document(
+                page_content=doc.page_content,
+                metadata={**doc.metadata, "rerank_score": round(score, 4)},
+            )
+            for score, doc in scored[:k]
+        ]
 
-        log.info(
-            f"Reranked {len(candidates)} → {len(top_k)} | "
-            f"top score={scored[0][0]:.3f} | bottom={scored[k-1][0]:.3f}"
-            if len(scored) >= k else
-            f"Reranked {len(candidates)} → {len(top_k)}"
-        )
+        if len(scored) >= k:
+            log.info(
+                "Reranked %d → %d | top score=%.3f | bottom=%.3f",
+                len(candidates), len(top_k), scored[0][0], scored[k-1][0],
+            )
+        else:
+            log.info("Reranked %d → %d", len(candidates), len(top_k))
         return top_k
 
+    def warmup(self) -> None:
+        """Load the model and run one tiny inference so the first query doesn't."""
+        try:
+            self._score("warmup", ["warmup"])
+            log.info("Reranker warmed up")
+        except Exception as exc:
+            log.warning(f"Reranker warmup failed: {exc} — will load on first query")
+
     # ── diagnostics ───────────────────────────────────────────────────────────
     def score_single(self, query: str, text: str) -> float:
         """Score one (query, text) pair. Useful for unit tests."""
-        return float(self._model.predict([[query, text]])[0])
+        return float(self._score(query, [text])[0])
+
+    def _score(self, query: str, texts: list[str]) -> list[float]:
+        if self._remote is not None:
+            return self._remote.rerank(query, texts)
+        # CrossEncoder needs list of [query, text] pairs. One forward pass for
+        # the whole candidate list (fused lists run past the default 32);
+        # torch already spreads that pass over intra-op threads.
+        pairs = [[query, t] for t in texts]
+        return self._model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
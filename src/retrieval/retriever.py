@@ -25,6 +25,9 @@ Config knobs (env vars):
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Optional
 
@@ -40,6 +43,13 @@ from src.retrieval.reranker import CrossEncoderReranker
 
 log = get_logger("Retriever")
 
+# Shared by all retrievers: FAISS search and BM25 scoring release the GIL
+# in their numpy/C++ kernels, so dense + sparse genuinely overlap.
+_FANOUT = ThreadPoolExecutor(max_workers=4, thread_name_prefix="retrieval")
+
+# structural metadata fields that exact/range lookups filter on
+_REF_FIELDS = ("recital", "chapter", "section", "article", "point", "subpoint")
+
 
 class SmartRetriever:
 
@@ -48,6 +58,8 @@ class SmartRetriever:
         self._bm25     = bm25
         self._analyzer = QueryAnalyzer()
         self._reranker = CrossEncoderReranker()
+        if cfg.RERANKER_WARMUP:
+            self._reranker.warmup()
         log.info("SmartRetriever initialised (FAISS + BM25 + CrossEncoder)")
 
     # ── cached flat doc list (for metadata filtering) ─────────────────────────
@@ -59,6 +71,18 @@ class SmartRetriever:
         log.info(f"Docstore cached: {len(docs)} documents")
         return docs
 
+    @cached_property
+    def _meta_index(self) -> dict[tuple[str, str], list[int]]:
+        """(field, str(value)) → ascending positions in _all_docs."""
+        index: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+        for pos, d in enumerate(self._all_docs):
+            meta = d.metadata
+            for field in _REF_FIELDS:
+                v = meta.get(field)
+                if v is not None:
+                    index[(field, str(v))].append(pos)
+        return dict(index)
+
     # ── public ────────────────────────────────────────────────────────────────
     def retrieve(
         self,
@@ -80,7 +104,7 @@ class SmartRetriever:
         elif analysis.intent == Intent.RANGE:
             candidates = self._range_candidates(analysis, fetch)
             # range queries: skip reranker, ordering by article number is better
-            log.info(f"RANGE: {len(candidates)} docs, skipping reranker")
+            log.info("RANGE: %d docs, skipping reranker", len(candidates))
             return candidates[:k], analysis
         else:
             candidates = self._hybrid_candidates(query, fetch)
@@ -94,24 +118,30 @@ class SmartRetriever:
         final = self._reranker.rerank(query, candidates, k=k)
 
         log.info(
-            f"retrieve done | intent={analysis.intent.value} "
-            f"candidates={len(candidates)} → final={len(final)}"
+            "retrieve done | intent=%s candidates=%d → final=%d",
+            analysis.intent.value, len(candidates), len(final),
         )
         return final, analysis
 
+    async def aretrieve(
+        self,
+        query: str,
+        k: Optional[int] = None,
+    ) -> tuple[list[Document], QueryAnalysis]:
+        """Async variant — runs the blocking pipeline off the event loop."""
+        return await asyncio.to_thread(self.retrieve, query, k)
+
     # ── candidate gathering strategies ───────────────────────────────────────
     def _hybrid_candidates(self, query: str, fetch: int) -> list[Document]:
         """
         Run FAISS and BM25 in parallel, fuse with RRF.
         Returns up to fetch*2 unique candidates for the reranker.
         """
-        dense  = self._vs.similarity_search(query, k=fetch)
-        sparse = self._bm25.search(query, k=fetch)
-        fused  = reciprocal_rank_fusion(dense, sparse)
-        log.debug(
-            f"Hybrid | dense={len(dense)} sparse={len(sparse)} "
-            f"fused={len(fused)}"
-        )
+        dense_f = _FANOUT.submit(self._vs.similarity_search, query, k=fetch)
+        sparse  = self._bm25.search(query, k=fetch)     # overlaps with FAISS
+        dense   = dense_f.result()
+        fused   = reciprocal_rank_fusion(dense, sparse)
+        log.debug("Hybrid | dense=%d sparse=%d fused=%d", len(dense), len(sparse), len(fused))
         return fused
 
     def _exact_candidates(self, analysis: QueryAnalysis, fetch: int) -> list[Document]:
@@ -121,17 +151,18 @@ class SmartRetriever:
           - Augment with hybrid search for same article context
           - Fuse via RRF
         """
+        docs    = self._all_docs
         filt    = analysis.filter_dict()
-        matched = [d for d in self._all_docs if self._matches(d, filt)]
+        hits    = self._lookup(filt)
+        matched = [docs[i] for i in hits]
         matched.sort(key=_specificity, reverse=True)
 
         # Include parent article chunks for full context
         if analysis.subpoint or analysis.point:
             parent = {k: v for k, v in filt.items()
                       if k not in ("subpoint", "point")}
-            for d in self._all_docs:
-                if d not in matched and self._matches(d, parent):
-                    matched.append(d)
+            seen = set(hits)
+            matched.extend(docs[i] for i in self._lookup(parent) if i not in seen)
 
         # Hybrid search for same query (catches paraphrased / surrounding context)
         hybrid = self._hybrid_candidates(analysis.query, fetch)
@@ -142,21 +173,27 @@ class SmartRetriever:
 
     def _range_candidates(self, analysis: QueryAnalysis, fetch: int) -> list[Document]:
         """Return article-level docs for a chapter/section, sorted by article number."""
-        out: list[Document] = []
-        for d in self._all_docs:
-            if analysis.chapter and str(d.metadata.get("chapter")) != str(analysis.chapter):
-                continue
-            if analysis.section and str(d.metadata.get("section")) != str(analysis.section):
-                continue
-            if d.metadata.get("level") == "article":
-                out.append(d)
+        docs = self._all_docs
+        filt = {k: v for k, v in (("chapter", analysis.chapter), ("section", analysis.section)) if v}
+        out  = [d for d in (docs[i] for i in self._lookup(filt)) if d.metadata.get("level") == "article"]
         out.sort(key=lambda d: int(d.metadata.get("article", 0) or 0))
         return out[:fetch]
 
     # ── helpers ───────────────────────────────────────────────────────────────
-    @staticmethod
-    def _matches(doc: Document, filt: dict) -> bool:
-        return all(str(doc.metadata.get(k)) == str(v) for k, v in filt.items())
+    def _lookup(self, filt: dict) -> list[int]:
+        """Positions in _all_docs whose metadata matches every filter field."""
+        if not filt:
+            return list(range(len(self._all_docs)))
+        postings = sorted(
+            (self._meta_index.get((k, str(v)), ()) for k, v in filt.items()),
+            key=len,
+        )
+        hits = set(postings[0])          # intersect smallest-first
+        for p in postings[1:]:
+            if not hits:
+                break
+            hits.intersection_update(p)
+        return sorted(hits)
 
 
 def _specificity(doc: Document) -> int:
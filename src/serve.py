@@ -0,0 +1,49 @@
+"""
+Production Server
+=================
+Gunicorn master + API_WORKERS Uvicorn workers, so /chat requests are
+spread over several interpreters instead of serialising on one.
+
+    python -m src.serve
+
+Each worker runs the FastAPI lifespan itself, so each holds its own
+copy of the FAISS index and models — size API_WORKERS to available RAM.
+preload_app only shares the imported code.
+"""
+
+from __future__ import annotations
+
+from gunicorn.app.base import BaseApplication
+
+import src.config as cfg
+
+
+class _GunicornServer(BaseApplication):
+
+    def __init__(self, options: dict) -> None:
+        self._options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self._options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from src.api import app
+        return app
+
+
+def main() -> None:
+    _GunicornServer({
+        "bind":         f"{cfg.API_HOST}:{cfg.API_PORT}",
+        "workers":      cfg.API_WORKERS,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app":  True,
+        "timeout":      120,
+        # UvicornWorker already picks uvloop + httptools when installed
+        "accesslog":    "-" if cfg.API_ACCESS_LOG else None,
+    }).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Embedding Micro-Batcher
+=======================
+Concurrent /chat requests each need one query embedding.  Calling the
+model once per request leaves it mostly idle; instead, pending queries
+arriving within EMBED_MAX_WAIT_MS are gathered and encoded in a single
+embed_documents() call (up to EMBED_MAX_BATCH texts).
+
+Callers are plain threads (the API's chat pool), so the batcher uses a
+queue + background thread and hands results back via Futures.
+
+Assumes the wrapped model embeds queries and documents identically
+(true for the sentence-transformers models configured here; not for
+instruction-prefixed models such as e5/bge-with-prompt).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from langchain_core.embeddings import Embeddings
+
+import src.config as cfg
+from src.logger import get_logger
+
+log = get_logger("EmbeddingBatcher")
+
+
+class BatchingEmbeddings(Embeddings):
+
+    def __init__(
+        self,
+        inner: Embeddings,
+        max_batch: int = cfg.EMBED_MAX_BATCH,
+        max_wait_ms: float = cfg.EMBED_MAX_WAIT_MS,
+    ) -> None:
+        self._inner     = inner
+        self._max_batch = max_batch
+        self._max_wait  = max_wait_ms / 1000
+        self._queue: queue.SimpleQueue[tuple[str, Future]] = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="embed-batcher", daemon=True).start()
+
+    # ── Embeddings interface ──────────────────────────────────────────────────
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        fut: Future = Future()
+        self._queue.put((text, fut))
+        return fut.result()
+
+    # ── worker ────────────────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                vectors = self._inner.embed_documents([text for text, _ in batch])
+            except Exception as exc:
+                log.error(f"Batch embed failed ({len(batch)} queries): {exc}")
+                for _, fut in batch:
+                    fut.set_exception(exc)
+                continue
+
+            if len(batch) > 1:
+                log.debug("Embedded %d queries in one batch", len(batch))
+            for (_, fut), vec in zip(batch, vectors):
+                fut.set_result(vec)
@@ -0,0 +1,72 @@
+"""
+Model Server Client
+===================
+Optional: offload embedding + reranking to a Hugging Face
+text-embeddings-inference (TEI) sidecar instead of loading the models
+inside every API worker.  One copy of the weights serves all workers.
+
+Endpoints are either a URL ("http://tei-embed:80") or a Unix domain
+socket ("unix:///tmp/emb.sock") — UDS skips the TCP stack entirely
+when the sidecar runs on the same host.
+
+Enabled by EMBEDDING_SERVER / RERANKER_SERVER; empty = local models.
+"""
+
+from __future__ import annotations
+
+import httpx
+from langchain_core.embeddings import Embeddings
+
+from src.logger import get_logger
+
+log = get_logger("TEIClient")
+
+_UDS_PREFIX = "unix://"
+_MAX_BATCH  = 32     # TEI default --max-client-batch-size
+
+
+class TEIClient:
+
+    def __init__(self, endpoint: str, timeout: float = 30.0) -> None:
+        if endpoint.startswith(_UDS_PREFIX):
+            transport = httpx.HTTPTransport(uds=endpoint[len(_UDS_PREFIX):])
+            base_url  = "http://tei"      # host is ignored over UDS
+        else:
+            transport = None
+            base_url  = endpoint.rstrip("/")
+        self._http = httpx.Client(base_url=base_url, transport=transport, timeout=timeout)
+        log.info(f"Model server: {endpoint}")
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        out: list[list[float]] = []
+        for i in range(0, len(texts), _MAX_BATCH):
+            # normalize=False matches HuggingFaceEmbeddings' default output
+            r = self._http.post("/embed", json={
+                "inputs":    texts[i:i + _MAX_BATCH],
+                "normalize": False,
+                "truncate":  True,
+            })
+            r.raise_for_status()
+            out.extend(r.json())
+        return out
+
+    def rerank(self, query: str, texts: list[str]) -> list[float]:
+        """Relevance score per text, in input order (sigmoid, like CrossEncoder.predict)."""
+        r = self._http.post("/rerank", json={"query": query, "texts": texts, "truncate": True})
+        r.raise_for_status()
+        scores = [0.0] * len(texts)
+        for item in r.json():
+            scores[item["index"]] = float(item["score"])
+        return scores
+
+
+class TEIEmbeddings(Embeddings):
+
+    def __init__(self, client: TEIClient) -> None:
+        self._client = client
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._client.embed(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._client.embed([text])[0]
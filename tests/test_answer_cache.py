@@ -0,0 +1,96 @@
+"""
+Unit tests for SemanticAnswerCache — in-memory FAISS, no model needed.
+"""
+import time
+
+from src.caching.answer_cache import SemanticAnswerCache
+
+
+def _cache(**kw) -> SemanticAnswerCache:
+    kw.setdefault("max_size", 4)
+    kw.setdefault("threshold", 0.97)
+    kw.setdefault("ttl_s", 60)
+    return SemanticAnswerCache(**kw)
+
+
+def test_empty_cache_misses():
+    assert _cache().get([1.0, 0.0], "v2|") is None
+
+
+def test_near_duplicate_hits():
+    c = _cache()
+    c.add([1.0, 0.0, 0.0], "v2|", {"answer": "A"})
+    assert c.get([0.99, 0.01, 0.0], "v2|") == {"answer": "A"}
+
+
+def test_dissimilar_misses():
+    c = _cache()
+    c.add([1.0, 0.0], "v2|", {"answer": "A"})
+    assert c.get([0.0, 1.0], "v2|") is None
+
+
+def test_scope_must_match():
+    c = _cache()
+    c.add([1.0, 0.0], "v2|article=15", {"answer": "A"})
+    assert c.get([1.0, 0.0], "v2|article=16") is None
+
+
+def test_out_of_scope_nearest_does_not_hide_in_scope_hit():
+    c = _cache()
+    c.add([1.0, 0.0, 0.0], "v2|article=16", {"answer": "B"})   # exact nearest, wrong scope
+    c.add([0.99, 0.01, 0.0], "v2|article=15", {"answer": "A"})
+    assert c.get([1.0, 0.0, 0.0], "v2|article=15") == {"answer": "A"}
+
+
+def test_evicts_least_used_when_full():
+    c = _cache(max_size=2)
+    c.add([1.0, 0.0, 0.0], "s", {"answer": "A"})
+    c.add([0.0, 1.0, 0.0], "s", {"answer": "B"})
+    assert c.get([1.0, 0.0, 0.0], "s")           # A now has a hit
+    c.add([0.0, 0.0, 1.0], "s", {"answer": "C"})  # evicts B
+    assert len(c) == 2
+    assert c.get([0.0, 1.0, 0.0], "s") is None
+    assert c.get([0.0, 0.0, 1.0], "s") == {"answer": "C"}
+
+
+def test_ttl_expiry():
+    c = _cache(ttl_s=0.01)
+    c.add([1.0, 0.0], "s", {"answer": "A"})
+    time.sleep(0.02)
+    assert c.get([1.0, 0.0], "s") is None
+    assert len(c) == 0
+
+
+def test_clear():
+    c = _cache()
+    c.add([1.0, 0.0], "s", {"answer": "A"})
+    c.clear()
+    assert len(c) == 0
+    assert c.get([1.0, 0.0], "s") is None
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "answers.pkl"
+    c = _cache()
+    c.add([1.0, 0.0], "s", {"answer": "A"})
+    c.add([0.0, 1.0], "s", {"answer": "B"})
+    assert c.save(path, tag="idx1") == 2
+
+    warm = _cache()
+    assert warm.load(path, tag="idx1") == 2
+    assert warm.get([0.0, 1.0], "s") == {"answer": "B"}
+
+
+def test_snapshot_with_other_tag_ignored(tmp_path):
+    path = tmp_path / "answers.pkl"
+    c = _cache()
+    c.add([1.0, 0.0], "s", {"answer": "A"})
+    c.save(path, tag="idx1")
+
+    warm = _cache()
+    assert warm.load(path, tag="idx2") == 0
+    assert len(warm) == 0
+
+
+def test_missing_snapshot_is_cold(tmp_path):
+    assert _cache().load(tmp_path / "nope.pkl") == 0
@@ -29,7 +29,51 @@ def test_chat_empty_query(client):
     assert r.status_code == 422
 
 
+def test_chat_blank_query(client):
+    r = client.post("/chat", json={"query": "   ", "session_id": "test"})
+    assert r.status_code == 422
+
+
+def test_chat_unknown_field_rejected(client):
+    r = client.post("/chat", json={"query": "What is Article 1?", "top_k": 50})
+    assert r.status_code == 422
+
+
 def test_chat_valid_query(client):
     r = client.post("/chat", json={"query": "What is Article 1?", "session_id": "test"})
     # 200 if engine ready, 503 if not (CI without API key)
     assert r.status_code in (200, 503)
+
+
+def test_chat_stream_returns_slot(client):
+    import src.config as cfg
+    r = client.post("/chat/stream", json={"query": "What is Article 3?", "session_id": "stream"})
+    if r.status_code != 200:
+        pytest.skip("engine not ready")
+    assert r.text.startswith("data: ")
+    assert app.state.chat_slots._value == cfg.MAX_INFLIGHT_CHATS
+
+
+def test_chat_etag_not_modified(client):
+    body = {"query": "What is Article 2?", "session_id": "etag"}
+    r = client.post("/chat", json=body)
+    if r.status_code != 200:
+        pytest.skip("engine not ready")
+    etag = r.headers["etag"]
+    r = client.post("/chat", json=body, headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test_chat_never_issued_etag_not_honoured(client):
+    from src.api import ChatRequest, _etag
+    body = {"query": "What is Article 4?", "session_id": "etag-forged"}
+    forged = _etag(ChatRequest(**body), "any-index", "any-prompt", "any answer")
+    r = client.post("/chat", json=body, headers={"If-None-Match": forged})
+    assert r.status_code != 304
+
+
+def test_etag_wildcard_never_matches():
+    from src.api import _etag_matches
+    assert not _etag_matches("*", '"abc"')
+    assert _etag_matches('W/"abc", "def"', '"abc"')
@@ -0,0 +1,39 @@
+"""
+Unit tests for NearDuplicateFilter — SimHash near-duplicate detection.
+"""
+from src.ingestion.dedup import NearDuplicateFilter, simhash
+
+_TEXT = (
+    "The controller shall implement appropriate technical and organisational "
+    "measures to ensure a level of security appropriate to the risk, including "
+    "inter alia as appropriate the pseudonymisation and encryption of personal data "
+    "and the ability to ensure the ongoing confidentiality integrity and availability."
+)
+
+
+def test_simhash_is_deterministic():
+    assert simhash(_TEXT) == simhash(_TEXT)
+
+
+def test_exact_duplicate_dropped():
+    f = NearDuplicateFilter(max_distance=3, min_chars=50)
+    assert f.is_new(_TEXT)
+    assert not f.is_new(_TEXT)
+    assert f.dropped == 1
+
+
+def test_different_text_kept():
+    f = NearDuplicateFilter(max_distance=3, min_chars=50)
+    other = (
+        "Each supervisory authority shall be competent for the performance of the tasks "
+        "assigned to and the exercise of the powers conferred on it in accordance with "
+        "this Regulation on the territory of its own Member State, without exception."
+    )
+    assert f.is_new(_TEXT)
+    assert f.is_new(other)
+
+
+def test_short_chunks_always_kept():
+    f = NearDuplicateFilter(max_distance=3, min_chars=50)
+    assert f.is_new("(a) the data subject has given consent")
+    assert f.is_new("(a) the data subject has given consent")
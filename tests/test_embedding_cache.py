@@ -0,0 +1,46 @@
+"""
+Unit tests for CachedEmbeddings — fake embedder, no model download.
+"""
+from langchain_core.embeddings import Embeddings
+
+from src.caching.embedding_cache import CachedEmbeddings, normalise_query
+
+
+class _CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [float(len(text)), 1.0]
+
+
+def test_normalise_collapses_whitespace():
+    assert normalise_query("  what   is\nArticle 15 ") == "what is Article 15"
+
+
+def test_repeat_query_hits_cache():
+    inner = _CountingEmbeddings()
+    emb = CachedEmbeddings(inner, max_size=8)
+    v1 = emb.embed_query("right to erasure")
+    v2 = emb.embed_query("  right   to erasure ")
+    assert v1 == v2
+    assert inner.calls == 1
+    assert emb.cache_info()["hits"] == 1
+
+
+def test_returned_vector_is_a_copy():
+    emb = CachedEmbeddings(_CountingEmbeddings(), max_size=8)
+    v = emb.embed_query("consent")
+    v.append(99.0)
+    assert emb.embed_query("consent") == [7.0, 1.0]
+
+
+def test_embed_documents_not_cached():
+    inner = _CountingEmbeddings()
+    emb = CachedEmbeddings(inner, max_size=8)
+    emb.embed_documents(["a", "a"])
+    assert inner.calls == 2
@@ -53,3 +53,11 @@ def test_one_empty_one_full():
     docs = [_doc("a", "a"), _doc("b", "b")]
     result = reciprocal_rank_fusion([], docs)
     assert len(result) == 2
+
+
+def test_chunk_id_separates_splits_of_same_reference():
+    # two splits of one oversize article share reference_path but not chunk_id
+    a = Document(page_content="part 1", metadata={"reference_path": "art:5", "chunk_id": "h:0"})
+    b = Document(page_content="part 2", metadata={"reference_path": "art:5", "chunk_id": "h:1"})
+    assert _doc_key(a) != _doc_key(b)
+    assert len(reciprocal_rank_fusion([a, b], [b])) == 2
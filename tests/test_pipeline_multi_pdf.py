@@ -47,3 +47,70 @@ def test_no_pdfs_raises(tmp_path, monkeypatch):
     pipeline = IngestionPipeline()
     with pytest.raises(Exception, match="No PDF"):
         pipeline.run()
+
+
+def test_stream_no_pdfs_raises(tmp_path, monkeypatch):
+    import src.config as cfg
+    monkeypatch.setattr(cfg, "DATA_DIR", tmp_path)
+    pipeline = IngestionPipeline()
+    with pytest.raises(Exception, match="No PDF"):
+        next(pipeline.stream())
+
+
+def test_split_cache_round_trip(tmp_path, monkeypatch):
+    import src.config as cfg
+    monkeypatch.setattr(cfg, "SPLIT_CACHE_DIR", tmp_path / "split_cache")
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF fake")
+    # source_file as the real _iter_one stamps it — cache hits re-stamp it from the path
+    docs = [Document(page_content="Article 17 text", metadata={"article": "17", "page": 3, "source_file": "a.pdf"})]
+    pipeline = IngestionPipeline()
+    monkeypatch.setattr(pipeline, "_iter_one", lambda path, file_hash=None: iter(docs))
+    assert pipeline._ingest_one(pdf) == docs
+
+    # second run must not touch the parser
+    monkeypatch.setattr(pipeline, "_iter_one", lambda *a, **k: pytest.fail("re-parsed"))
+    assert pipeline._ingest_one(pdf) == docs
+
+
+def test_split_cache_keyed_on_chunk_config(monkeypatch):
+    import src.config as cfg
+    pipeline = IngestionPipeline()
+    before = pipeline._config_key()
+    monkeypatch.setattr(cfg, "CHUNK_SIZE", cfg.CHUNK_SIZE + 1)
+    assert pipeline._config_key() != before
+
+
+def test_split_cache_hit_restamps_source_file(tmp_path, monkeypatch):
+    import src.config as cfg
+    monkeypatch.setattr(cfg, "SPLIT_CACHE_DIR", tmp_path / "split_cache")
+    original, renamed = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    original.write_bytes(b"%PDF same bytes")
+    renamed.write_bytes(b"%PDF same bytes")
+    pipeline = IngestionPipeline()
+    monkeypatch.setattr(
+        pipeline, "_iter_one",
+        lambda path, file_hash=None: iter([Document(page_content="x", metadata={"source_file": path.name})]),
+    )
+    pipeline._ingest_one(original)
+    assert pipeline._ingest_one(renamed)[0].metadata["source_file"] == "b.pdf"
+
+
+def test_stream_drops_pdf_that_fails_mid_parse(tmp_path, monkeypatch):
+    import src.config as cfg
+    monkeypatch.setattr(cfg, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(cfg, "SPLIT_CACHE", False)
+    monkeypatch.setattr(cfg, "DEDUP_CHUNKS", False)
+    (tmp_path / "a_bad.pdf").write_bytes(b"%PDF bad")
+    (tmp_path / "b_good.pdf").write_bytes(b"%PDF good")
+
+    def _iter_one(path, file_hash=None):
+        yield Document(page_content=f"{path.name} chunk 1", metadata={})
+        if path.name == "a_bad.pdf":
+            raise ValueError("corrupt page")
+        yield Document(page_content=f"{path.name} chunk 2", metadata={})
+
+    pipeline = IngestionPipeline()
+    monkeypatch.setattr(pipeline, "_iter_one", _iter_one)
+    streamed = [d.page_content for batch in pipeline.stream(batch_size=1) for d in batch]
+    assert streamed == ["b_good.pdf chunk 1", "b_good.pdf chunk 2"]
@@ -59,3 +59,8 @@ def test_semantic_intent(query):
 def test_offtopic_low_confidence():
     r = ana.analyze("Hi there!")
     assert r.confidence < 0.5
+
+
+def test_repeat_query_served_from_cache():
+    first = ana.analyze("What is Article 17?")
+    assert ana.analyze("  What is Article 17?  ") is first
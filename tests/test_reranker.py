@@ -54,3 +54,8 @@ def test_score_single(reranker):
         "Article 15 grants data subjects the right to obtain access to personal data."
     )
     assert isinstance(score, float)
+
+
+def test_warmup_loads_model(reranker):
+    reranker.warmup()
+    assert "_model" in reranker.__dict__
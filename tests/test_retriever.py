@@ -0,0 +1,54 @@
+"""
+Unit tests for SmartRetriever metadata lookup — no FAISS, docs injected directly.
+"""
+from langchain_core.documents import Document
+
+from src.retrieval.query_analyzer import Intent, QueryAnalysis
+from src.retrieval.retriever import SmartRetriever
+
+
+def _retriever(docs):
+    r = SmartRetriever.__new__(SmartRetriever)
+    r.__dict__["_all_docs"] = docs      # bypass the docstore-backed cached_property
+    return r
+
+
+_DOCS = [
+    Document(page_content="Art 15", metadata={"article": "15", "level": "article"}),
+    Document(page_content="Art 15(1)", metadata={"article": "15", "point": "1", "level": "point"}),
+    Document(page_content="Art 16", metadata={"article": "16", "level": "article"}),
+    Document(page_content="Art 15(1)(a)", metadata={"article": "15", "point": "1", "subpoint": "a"}),
+]
+
+
+def test_lookup_intersects_fields():
+    r = _retriever(_DOCS)
+    assert r._lookup({"article": "15", "point": "1"}) == [1, 3]
+
+
+def test_lookup_matches_on_string_form():
+    r = _retriever(_DOCS)
+    assert r._lookup({"article": 16}) == [2]
+
+
+def test_lookup_unknown_value_empty():
+    r = _retriever(_DOCS)
+    assert r._lookup({"article": "99"}) == []
+
+
+def test_lookup_empty_filter_matches_all():
+    r = _retriever(_DOCS)
+    assert r._lookup({}) == [0, 1, 2, 3]
+
+
+def test_range_returns_articles_of_chapter_in_order():
+    docs = [
+        Document(page_content="Art 17", metadata={"chapter": "III", "article": "17", "level": "article"}),
+        Document(page_content="Art 15", metadata={"chapter": "III", "article": "15", "level": "article"}),
+        Document(page_content="Art 15(1)", metadata={"chapter": "III", "article": "15", "level": "point"}),
+        Document(page_content="Art 5", metadata={"chapter": "II", "article": "5", "level": "article"}),
+    ]
+    r = _retriever(docs)
+    analysis = QueryAnalysis(intent=Intent.RANGE, query="chapter III", chapter="III")
+    out = r._range_candidates(analysis, fetch=10)
+    assert [d.page_content for d in out] == ["Art 15", "Art 17"]
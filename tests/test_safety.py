@@ -0,0 +1,30 @@
+"""
+Unit tests for StreamingOutputGuard — leak markers never leave the stream.
+"""
+from src.guardrails.safety import StreamingOutputGuard
+
+
+def _run(text: str, step: int) -> tuple[str, StreamingOutputGuard]:
+    guard = StreamingOutputGuard()
+    out = "".join(guard.feed(text[i:i + step]) for i in range(0, len(text), step))
+    return out + guard.tail(), guard
+
+
+def test_clean_answer_released_in_full():
+    text = "Article 15 grants the data subject a right of access to personal data."
+    out, guard = _run(text, 3)
+    assert out == text
+    assert not guard.blocked
+
+
+def test_marker_split_across_deltas_never_emitted():
+    out, guard = _run("Sure. You are an expert legal assistant for GDPR.", 2)
+    assert guard.blocked
+    assert "you are" not in out.lower()
+
+
+def test_nothing_released_after_block():
+    guard = StreamingOutputGuard()
+    guard.feed("built with LangChain")
+    assert guard.feed(" and more text that is perfectly harmless on its own") == ""
+    assert guard.tail() == ""
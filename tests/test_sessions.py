@@ -0,0 +1,39 @@
+"""
+Unit tests for SessionStore — LRU eviction and per-session history cap.
+"""
+from src.rag.sessions import SessionStore
+
+
+def test_same_session_returns_same_history():
+    store = SessionStore(max_sessions=4, max_turns=2)
+    assert store.get_or_create("a") is store.get_or_create("a")
+
+
+def test_least_recently_used_session_evicted():
+    store = SessionStore(max_sessions=2, max_turns=2)
+    a = store.get_or_create("a")
+    store.get_or_create("b")
+    store.get_or_create("a")          # touch — "b" is now oldest
+    store.get_or_create("c")
+    assert len(store) == 2
+    assert store.get_or_create("a") is a
+    assert len(store.get_or_create("b").messages) == 0
+
+
+def test_history_keeps_last_turns():
+    history = SessionStore(max_sessions=2, max_turns=2).get_or_create("s")
+    for i in range(5):
+        history.add_user_message(f"q{i}")
+        history.add_ai_message(f"a{i}")
+    assert [m.content for m in history.messages] == ["q3", "a3", "q4", "a4"]
+
+
+def test_last_turn_is_newest_question_and_answer():
+    store = SessionStore(max_sessions=2, max_turns=2)
+    assert store.last_turn("s") is None
+    assert len(store) == 0                # peeking never creates a session
+    history = store.get_or_create("s")
+    history.add_user_message("q0")
+    assert store.last_turn("s") is None   # unanswered question
+    history.add_ai_message("a0")
+    assert store.last_turn("s") == ("q0", "a0")